@@ -21,6 +21,7 @@ setuptools.setup(
     entry_points={
         'console_scripts': [
             'wallthick=wallthick.cli:main',
+            'wallthick-batch=wallthick.cli:run_batch',
         ],
     },
     install_requires=open('requirements.txt').readlines(),
@@ -24,3 +24,11 @@ def test_recommended_wall_thickness_non_api_D_o():
 def test_recommended_wall_thickness_wt_greater_than_standard():
     with pytest.raises(ValueError):
         api.recommended_wall_thickness(60.3e-3, 12e-3)
+
+
+def test_recommended_wall_thickness_errors_not_printed(capsys):
+    with pytest.raises(KeyError, match='not standard API 5L size'):
+        api.recommended_wall_thickness(100e-3, 1e-3)
+    with pytest.raises(ValueError, match='greater than available'):
+        api.recommended_wall_thickness(60.3e-3, 12e-3)
+    assert capsys.readouterr().out == ''
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import wallthick
+from wallthick import batch
+
+from test_pd8010 import test_data
+
+tol_pc = 0.001
+
+
+@pytest.mark.parametrize("output", batch.outputs)
+def test_evaluate_matches_pd8010(output):
+    expected = getattr(wallthick.Pd8010(test_data[0]), output)
+    result = batch.evaluate(test_data[0])[output]
+    assert abs(result - expected) <= tol_pc * expected
+
+
+def test_evaluate_arrays():
+    data = dict(test_data[0])
+    data['h'] = np.array([50, 111, 200])
+    data['P_d'] = np.array([5e6, 13e6, 20e6])
+    results = batch.evaluate(data)
+    for i in range(3):
+        case = dict(test_data[0], h=data['h'][i], P_d=data['P_d'][i])
+        pd = wallthick.Pd8010(case)
+        for output in batch.outputs:
+            expected = getattr(pd, output)
+            assert abs(results[output][i] - expected) <= tol_pc * expected
+
+
+@pytest.mark.parametrize("method", ['newton', 'bracket'])
+@pytest.mark.parametrize("P_o, sig_y, E, v, D_o, f_0, expected", [
+    (25.292e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-2, 3.260e-3),
+    (23.071e5, 450e6, 207e9, 0.3, 60.3e-3, 2.5e-2, 1.112316e-3)
+])
+def test_collapse_thickness(P_o, sig_y, E, v, D_o, f_0, expected, method):
+    assert abs(batch.collapse_thickness(
+        P_o, sig_y, E, v, D_o, f_0, method=method) - expected) <= \
+        tol_pc * expected
+
+
+def test_collapse_thickness_physical_root():
+    P_o = np.array([25.292e5, 43.22e5])
+    t = batch.collapse_thickness(P_o, 370e6, 207e9, 0.3, 0.1683, 2.5e-3)
+    lo, hi = batch.collapse_bracket(P_o, 370e6, 207e9, 0.3, 0.1683, 2.5e-3)
+    assert np.all((lo <= t) & (t <= hi))
+    assert abs(t[1] - 3.607e-3) <= tol_pc * 3.607e-3
+
+
+@pytest.mark.parametrize("method", ['newton', 'bracket'])
+def test_collapse_thickness_not_converged(method):
+    with pytest.raises(RuntimeError):
+        batch.collapse_thickness(25.292e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-2,
+                                 method=method, maxiter=1)
+
+
+def test_collapse_solver_warm_start():
+    P_o = np.linspace(20e5, 40e5, 50)
+    solver = batch.CollapseSolver()
+    cold = solver(P_o, 370e6, 207e9, 0.3, 0.1683, 2.5e-2)
+    cold_iterations = solver.mean_iterations
+    warm = solver(1.001 * P_o, 370e6, 207e9, 0.3, 0.1683, 2.5e-2)
+    assert solver.cases == 100
+    assert solver.mean_iterations < cold_iterations
+    expected = batch.collapse_thickness(1.001 * P_o, 370e6, 207e9, 0.3,
+                                        0.1683, 2.5e-2)
+    assert np.allclose(warm, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("outputs", [['t_h'], ['t_h', 'P_st'], ['P_lt'],
+                                     ['t_b', 't_c']])
+def test_evaluate_outputs(outputs):
+    data = dict(test_data[0], h=np.array([50, 111, 200]))
+    expected = batch.evaluate(data)
+    results = batch.evaluate(data, outputs=outputs)
+    assert list(results) == outputs
+    for name in outputs:
+        assert np.array_equal(results[name], expected[name])
+
+
+def test_evaluate_outputs_required_inputs():
+    data = {key: test_data[0][key] for key in batch.plan(['t_h'])}
+    results = batch.evaluate(data, outputs=['t_h'])
+    assert abs(results['t_h'] - test_data[0]['t_h']) <= \
+        tol_pc * test_data[0]['t_h']
+
+
+def test_evaluate_outputs_broadcast():
+    data = dict(test_data[0], h=np.array([50, 111, 200]))
+    assert batch.evaluate(data, outputs=['P_lt'])['P_lt'].shape == (3,)
+
+
+def test_plan():
+    assert batch.plan() == [key for key in batch.req_inputs if key != 'B']
+    assert batch.plan(['P_lt']) == ['P_d']
+    assert 'E' not in batch.plan(['t_h', 'P_st'])
+    with pytest.raises(ValueError):
+        batch.plan(['t_x'])
+    with pytest.raises(ValueError):
+        batch.plan([])
@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import checkpoint
+
+from test_pd8010 import test_data
+
+cases = [dict(test_data[0], h=h) for h in np.linspace(50, 150, 25)]
+key = checkpoint.input_hash(b'inputs')
+
+
+class Interrupt(Exception):
+    pass
+
+
+def interrupt_after(n):
+    def progress(completed, total):
+        if completed == n:
+            raise Interrupt()
+    return progress
+
+
+def read(output):
+    with open(output) as f:
+        assert f.readline().strip() == ','.join(['case'] + batch.outputs)
+    return np.loadtxt(output, delimiter=',', skiprows=1)
+
+
+def test_run(tmpdir):
+    output = str(tmpdir.join('results.csv'))
+    assert checkpoint.run(cases, output, key, chunk_size=10) == 3
+    results = read(output)
+    assert np.array_equal(results[:, 0], np.arange(25))
+    expected = batch.evaluate(
+        dict(test_data[0], h=np.linspace(50, 150, 25)))
+    for i, name in enumerate(batch.outputs):
+        assert np.allclose(results[:, i + 1], expected[name])
+    assert not os.path.exists(checkpoint.checkpoint_dir(output))
+
+
+def test_resume(tmpdir):
+    output = str(tmpdir.join('results.csv'))
+    expected = str(tmpdir.join('expected.csv'))
+    checkpoint.run(cases, expected, key, chunk_size=10)
+    with pytest.raises(Interrupt):
+        checkpoint.run(cases, output, key, chunk_size=10,
+                       progress=interrupt_after(2))
+    assert checkpoint.load_manifest(output)['completed'] == [0, 1]
+    assert not os.path.exists(output)
+    assert checkpoint.run(cases, output, key, chunk_size=10,
+                          resume=True) == 1
+    assert np.array_equal(read(output), read(expected))
+
+
+@pytest.mark.parametrize("new_key, chunk_size", [
+    (checkpoint.input_hash(b'other inputs'), 10),
+    (key, 5),
+])
+def test_resume_mismatch(tmpdir, new_key, chunk_size):
+    output = str(tmpdir.join('results.csv'))
+    with pytest.raises(Interrupt):
+        checkpoint.run(cases, output, key, chunk_size=10,
+                       progress=interrupt_after(2))
+    evaluated = checkpoint.run(cases, output, new_key, chunk_size=chunk_size,
+                               resume=True)
+    assert evaluated == -(-len(cases) // chunk_size)
+
+
+def test_run_outputs(tmpdir):
+    output = str(tmpdir.join('results.csv'))
+    outputs = ['t_h', 'P_st']
+    with pytest.raises(Interrupt):
+        checkpoint.run(cases, output, key, chunk_size=10,
+                       progress=interrupt_after(1))
+    # A checkpoint with different outputs is not resumed
+    assert checkpoint.run(cases, output, key, chunk_size=10, resume=True,
+                          outputs=outputs) == 3
+    with open(output) as f:
+        assert f.readline().strip() == 'case,t_h,P_st'
+    results = np.loadtxt(output, delimiter=',', skiprows=1)
+    expected = batch.evaluate(
+        dict(test_data[0], h=np.linspace(50, 150, 25)), outputs=outputs)
+    for i, name in enumerate(outputs):
+        assert np.allclose(results[:, i + 1], expected[name])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -2])
+def test_run_invalid_chunk_size(tmpdir, chunk_size):
+    output = str(tmpdir.join('results.csv'))
+    with pytest.raises(ValueError):
+        checkpoint.run(cases, output, key, chunk_size=chunk_size)
+    assert not os.path.exists(output)
+
+
+def test_resumable():
+    manifest = {'input_hash': key, 'chunk_size': 10,
+                'outputs': batch.outputs, 'completed': [0]}
+    assert checkpoint.resumable(manifest, key, 10)
+    assert checkpoint.resumable(manifest, key, 10, list(batch.outputs))
+    assert not checkpoint.resumable(None, key, 10)
+    assert not checkpoint.resumable(manifest, 'other', 10)
+    assert not checkpoint.resumable(manifest, key, 5)
+    assert not checkpoint.resumable(manifest, key, 10, ['t_h'])
@@ -3,6 +3,7 @@
 
 """Tests for cli module."""
 
+import os
 import pytest
 import json
 
@@ -10,6 +11,7 @@ import click
 
 from click.testing import CliRunner
 
+from wallthick import checkpoint
 from wallthick import cli
 
 test_inputs = {
@@ -64,3 +66,109 @@ def test_command_line_interface_missing_params():
         result = runner.invoke(cli.main, ['inputs.json'])
         assert result.exit_code == 0
         assert 'Check input data file includes all of the following:' in result.output
+
+
+def test_command_line_interface_batch():
+    """Test the batch CLI."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('inputs.json', 'w') as f:
+            json.dump([test_inputs] * 5, f)
+
+        result = runner.invoke(
+            cli.run_batch, ['inputs.json', 'results.csv', '--chunk-size', 2])
+        assert result.exit_code == 0
+        assert 'Chunk 3 of 3 complete.' in result.output
+        with open('results.csv') as f:
+            assert len(f.readlines()) == 6
+
+        result = runner.invoke(
+            cli.run_batch, ['inputs.json', 'results.csv', '--resume'])
+        assert result.exit_code == 0
+        assert 'Resuming' not in result.output
+
+
+def test_command_line_interface_batch_missing_params():
+    """Test the batch CLI."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('inputs.json', 'w') as f:
+            json.dump([test_inputs, {"D_o": 50}], f)
+
+        result = runner.invoke(cli.run_batch, ['inputs.json', 'results.csv'])
+        assert result.exit_code == 0
+        assert 'Check every case in the input data file' in result.output
+
+
+def test_command_line_interface_batch_outputs():
+    """Test the batch CLI with selected outputs."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('inputs.json', 'w') as f:
+            json.dump([{"P_d": 13000000}] * 3, f)
+
+        result = runner.invoke(
+            cli.run_batch, ['inputs.json', 'results.csv', '--outputs', 'P_lt'])
+        assert result.exit_code == 0
+        with open('results.csv') as f:
+            assert f.readline().strip() == 'case,P_lt'
+
+        result = runner.invoke(
+            cli.run_batch, ['inputs.json', 'results.csv', '--outputs', 't_x'])
+        assert result.exit_code != 0
+        assert 'Unknown outputs: t_x' in result.output
+
+
+@pytest.mark.parametrize("chunk_size", ['0', '-2'])
+def test_command_line_interface_batch_invalid_chunk_size(chunk_size):
+    """Test the batch CLI rejects chunk sizes below one."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('inputs.json', 'w') as f:
+            json.dump([test_inputs] * 5, f)
+
+        result = runner.invoke(
+            cli.run_batch,
+            ['inputs.json', 'results.csv', '--chunk-size', chunk_size])
+        assert result.exit_code == 2
+        assert '--chunk-size' in result.output
+        assert not os.path.exists('results.csv')
+
+
+class Interrupt(Exception):
+    pass
+
+
+def test_command_line_interface_batch_stale_checkpoint():
+    """Test the batch CLI reports a checkpoint it cannot resume."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('inputs.json', 'w') as f:
+            json.dump([test_inputs] * 5, f)
+        with open('inputs.json', 'rb') as f:
+            key = checkpoint.input_hash(f.read())
+
+        def interrupt(completed, total):
+            raise Interrupt()
+
+        with pytest.raises(Interrupt):
+            checkpoint.run([test_inputs] * 5, 'results.csv', key,
+                           chunk_size=2, progress=interrupt)
+
+        result = runner.invoke(
+            cli.run_batch,
+            ['inputs.json', 'results.csv', '--resume', '--chunk-size', '3'])
+        assert result.exit_code == 0
+        assert 'Resuming' not in result.output
+        assert 'Discarding checkpoint' in result.output
+        assert 'Chunk 2 of 2 complete.' in result.output
+
+        with pytest.raises(Interrupt):
+            checkpoint.run([test_inputs] * 5, 'results.csv', key,
+                           chunk_size=2, progress=interrupt)
+
+        result = runner.invoke(
+            cli.run_batch,
+            ['inputs.json', 'results.csv', '--resume', '--chunk-size', '2'])
+        assert result.exit_code == 0
+        assert 'Resuming: 1 chunks complete.' in result.output
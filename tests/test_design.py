@@ -0,0 +1,64 @@
+import numpy as np
+
+import wallthick
+from wallthick import api5l
+from wallthick import design
+from wallthick import dnvf101
+
+from test_pd8010 import test_data
+
+A_req = 0.01
+
+
+def test_search_feasible():
+    result = design.search(test_data[0], A_req, 100)
+    assert len(result['mass'])
+    assert np.all(np.diff(result['mass']) > 0)
+    assert np.all(np.diff(result['margin']) > 0)
+    for i in range(len(result['mass'])):
+        sig_y_d = dnvf101.derate_material(
+            result['grade'][i], api5l.grades[result['grade'][i]], 100)
+        pd = wallthick.Pd8010(dict(test_data[0], D_o=result['D_o'][i],
+                                   sig_y_d=sig_y_d))
+        t_req = max(pd.t_h, pd.t_c, pd.t_b)
+        assert abs(result['t_req'][i] - t_req) <= 1e-9
+        assert result['t_sel'][i] >= t_req
+        D_i = result['D_o'][i] - 2 * result['t_sel'][i]
+        assert np.pi / 4 * D_i**2 >= A_req
+
+
+def test_search_pareto():
+    result = design.search(test_data[0], A_req, 100)
+    # brute force over every diameter, wall and grade
+    candidates = []
+    for grade, sig_y in api5l.grades.items():
+        sig_y_d = dnvf101.derate_material(grade, sig_y, 100)
+        for size, walls in api5l.sizes.items():
+            pd = wallthick.Pd8010(dict(test_data[0], D_o=1e-3 * size,
+                                       sig_y_d=sig_y_d))
+            t_req = max(pd.t_h, pd.t_c, pd.t_b)
+            for wall in walls:
+                t = 1e-3 * wall
+                if t >= t_req and np.pi / 4 * (1e-3 * size - 2 * t)**2 >= \
+                        A_req:
+                    mass = design.rho_s * np.pi * (1e-3 * size - t) * t
+                    candidates.append((mass, t / t_req - 1))
+    pareto = [c for c in candidates
+              if not any(o[0] <= c[0] and o[1] >= c[1] and o != c
+                         for o in candidates)]
+    assert np.allclose(sorted(pareto),
+                       list(zip(result['mass'], result['margin'])))
+
+
+def test_search_infeasible():
+    result = design.search(test_data[0], 10, 100)
+    assert len(result['mass']) == 0
+
+
+def test_search_without_test_pressure_inputs():
+    data = {key: value for key, value in test_data[0].items()
+            if key not in ('t_sel', 'sig_y')}
+    result = design.search(data, A_req, 100)
+    expected = design.search(test_data[0], A_req, 100)
+    for key in ('D_o', 't_sel', 'mass', 'margin'):
+        assert np.array_equal(result[key], expected[key])
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import frames
+from wallthick.cli import req_inputs
+
+from test_pd8010 import test_data
+
+data = {name: test_data[0][name] for name in req_inputs}
+depths = [50, 111, 150]
+
+
+def expected():
+    return batch.evaluate(dict(data, h=np.array(depths, dtype=float)))
+
+
+def test_evaluate_frame():
+    pandas = pytest.importorskip('pandas')
+    df = pandas.DataFrame([dict(data, name='Pipe', h=h) for h in depths])
+    results = frames.evaluate_frame(df)
+    assert list(results.columns) == list(df.columns) + batch.outputs
+    assert 't_h' not in df.columns
+    for name, values in expected().items():
+        assert np.allclose(results[name].to_numpy(), values)
+
+
+def test_evaluate_frame_missing_columns():
+    pandas = pytest.importorskip('pandas')
+    with pytest.raises(KeyError):
+        frames.evaluate_frame(pandas.DataFrame({'D_o': [0.1683]}))
+
+
+def test_evaluate_table():
+    pyarrow = pytest.importorskip('pyarrow')
+    rows = [dict(data, h=float(h)) for h in depths]
+    # two record batches
+    table = pyarrow.concat_tables([pyarrow.Table.from_pylist(rows[:1]),
+                                   pyarrow.Table.from_pylist(rows[1:])])
+    results = frames.evaluate_table(table)
+    assert results.column_names == table.column_names + batch.outputs
+    for name, values in expected().items():
+        assert np.allclose(results.column(name).to_numpy(), values)
+
+
+def test_evaluate_arrays():
+    pyarrow = pytest.importorskip('pyarrow')
+    table = pyarrow.Table.from_pylist(
+        [dict(data, name='Pipe', h=float(h)) for h in depths])
+    results = frames.evaluate_arrays(table)
+    assert list(results) == batch.outputs
+    for name, values in expected().items():
+        assert np.allclose(results[name].to_numpy(), values)
+
+
+def test_evaluate_frame_outputs():
+    pandas = pytest.importorskip('pandas')
+    outputs = ['t_h', 'P_st']
+    df = pandas.DataFrame([{name: data[name] for name in batch.plan(outputs)}
+                           for h in depths]).assign(h=depths)
+    results = frames.evaluate_frame(df, outputs=outputs)
+    assert list(results.columns) == list(df.columns) + outputs
+    for name in outputs:
+        assert np.allclose(results[name].to_numpy(), expected()[name])
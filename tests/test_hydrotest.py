@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import hydrotest
+
+pipe = (0.0095, 0.125, 450e6, 0.3239, 13e6)
+
+
+def test_pressure_limits():
+    P_min, P_max = hydrotest.pressure_limits(*pipe, P_o=0)
+    assert P_min == 19.5e6
+    assert abs(P_max - 20.79e6) <= 0.001 * 20.79e6
+
+
+def test_plan_sections_flat():
+    kp = np.linspace(0, 10e3, 101)
+    plan = hydrotest.plan_sections(kp, np.zeros(101), *pipe)
+    assert list(plan['start']) == [0]
+    assert list(plan['end']) == [101]
+    assert np.allclose(plan['P_st'], 19.5e6)
+
+
+def test_plan_sections_profile():
+    # 1.29 MPa between the 1.5 * P_d and hoop stress limits allows around
+    # 128 m of elevation change per section
+    kp = np.linspace(0, 10e3, 1001)
+    z = -np.linspace(0, 500, 1001)
+    plan = hydrotest.plan_sections(kp, z, *pipe)
+    assert len(plan['start']) == 4
+    assert np.all(plan['P_st'] >= plan['P_min'])
+    assert np.all(plan['P_st'] <= plan['P_max'])
+    assert np.allclose(plan['P_test'], 19.5e6)
+    expected = batch.strength_test_pressure(*pipe, P_o=0, P_h=plan['P_h'])
+    assert np.allclose(plan['P_st'], expected)
+
+
+def test_plan_sections_minimum():
+    rng = np.random.RandomState(0)
+    z = np.cumsum(rng.normal(0, 20, 2000))
+    plan = hydrotest.plan_sections(np.arange(2000), z, *pipe)
+    for start, end in zip(plan['start'][:-1], plan['end'][:-1]):
+        # extending any section by one point would make it infeasible
+        head = 1027 * 9.81 * (z[start:end + 1].max() - z[start:end + 1].min())
+        assert head > plan['P_max'][0] - plan['P_min'][0]
+
+
+def test_plan_sections_infeasible():
+    with pytest.raises(ValueError):
+        hydrotest.plan_sections([0, 1], [0, 0], 0.005, 0.125, 450e6, 0.3239,
+                                13e6)
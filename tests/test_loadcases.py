@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import dnvf101
+from wallthick import loadcases
+from wallthick import pd8010
+
+from test_pd8010 import test_data
+
+tol_pc = 0.001
+
+
+def make_data():
+    data = dict(test_data[0], grade='CS X65')
+    data['h'] = np.array([50, 111, 200, 500])
+    return data
+
+
+def make_phases():
+    return {
+        'installation': loadcases.installation,
+        'hydrotest': loadcases.hydrotest(1.5 * 13e6),
+        'operation': loadcases.operation(13e6, 100),
+    }
+
+
+def test_operation_matches_batch():
+    data = dict(make_data(), t_corr=0.003)
+    results = loadcases.evaluate(data, make_phases())
+    sig_y_d = dnvf101.derate_material('CS X65', data['sig_y'], 100)
+    expected = batch.evaluate(dict(data, sig_y_d=sig_y_d))
+    for criterion in loadcases.criteria:
+        result = results['phases']['operation'][criterion]
+        assert np.allclose(result, expected[criterion], rtol=tol_pc)
+
+
+def test_installation_uses_sig_y_d():
+    data = make_data()
+    results = loadcases.evaluate(data, make_phases())
+    expected = batch.evaluate(data)
+    assert set(results['phases']['installation']) == {'t_c', 't_b'}
+    for criterion in ('t_c', 't_b'):
+        result = results['phases']['installation'][criterion]
+        assert np.allclose(result, expected[criterion], rtol=tol_pc)
+
+
+def test_hydrotest_hoop_thickness():
+    data = dict(make_data(), t_corr=0.003)
+    results = loadcases.evaluate(data, make_phases())
+    assert set(results['phases']['hydrotest']) == {'t_h'}
+    d_min, _ = pd8010.water_depths(data['h'], data['H_t'], data['H_w'])
+    P_o = pd8010.external_pressure(data['rho_w'], data['g'], d_min)
+    t_min = batch.hoop_thickness(1.5 * 13e6, P_o, data['D_o'],
+                                 data['sig_y'], 0.9)
+    expected = t_min / (1 - data['f_tol'])
+    assert np.allclose(results['phases']['hydrotest']['t_h'], expected)
+
+
+def test_envelope():
+    results = loadcases.evaluate(make_data(), make_phases())
+    t = [results['phases'][name][criterion]
+         for name in results['phases']
+         for criterion in results['phases'][name]]
+    assert np.array_equal(results['t_gov'], np.max(t, axis=0))
+    for i, (name, criterion) in enumerate(
+            zip(results['phase'], results['criterion'])):
+        assert results['phases'][name][criterion][i] == results['t_gov'][i]
+    # Deep water cases are governed by propagation buckling
+    assert results['criterion'][-1] == 't_b'
+
+
+def test_scalar():
+    results = loadcases.evaluate(test_data[0], {
+        'operation': {'P_d': 13e6, 'criteria': ['t_h', 't_c', 't_b']}})
+    expected = batch.evaluate(test_data[0])
+    t = [expected[criterion] for criterion in loadcases.criteria]
+    assert results['t_gov'] == pytest.approx(max(t))
+    assert results['criterion'] == loadcases.criteria[np.argmax(t)]
+    assert results['phase'] == 'operation'
+
+
+def test_missing_grade():
+    with pytest.raises(ValueError, match="'grade'"):
+        loadcases.evaluate(test_data[0],
+                           {'operation': loadcases.operation(13e6, 100)})
+
+
+def test_no_phases():
+    with pytest.raises(ValueError, match='phase'):
+        loadcases.evaluate(make_data(), {})
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import parallel
+
+from test_pd8010 import test_data
+
+
+def make_data(n=1000):
+    return dict(test_data[0], h=np.linspace(20, 500, n),
+                P_d=np.linspace(5e6, 20e6, n))
+
+
+@pytest.mark.parametrize("threads, chunk_size", [(1, 1000), (4, 64),
+                                                 (16, 7)])
+def test_evaluate_matches_batch(threads, chunk_size):
+    data = make_data()
+    expected = batch.evaluate(data)
+    results, errors = parallel.evaluate(data, threads=threads,
+                                        chunk_size=chunk_size)
+    assert errors == []
+    for name in batch.outputs:
+        assert np.array_equal(results[name], expected[name])
+
+
+def test_evaluate_outputs_shape():
+    data = dict(test_data[0], h=np.linspace(20, 500, 12).reshape(3, 4))
+    results, errors = parallel.evaluate(data, outputs=['t_h'], chunk_size=5)
+    assert list(results) == ['t_h']
+    assert results['t_h'].shape == (3, 4)
+    assert np.array_equal(results['t_h'], batch.evaluate(data)['t_h'])
+
+
+def test_evaluate_scalar():
+    results, errors = parallel.evaluate(test_data[0])
+    assert errors == []
+    assert results['t_h'] == batch.evaluate(test_data[0])['t_h']
+
+
+def test_evaluate_chunk_errors():
+    data = make_data(100)
+    # The collapse solver does not converge for an invalid modulus
+    data['E'] = np.full(100, 207e9)
+    data['E'][42] = np.nan
+    results, errors = parallel.evaluate(data, chunk_size=10)
+    assert len(errors) == 1
+    error = errors[0]
+    assert (error['chunk'], error['start'], error['stop']) == (4, 40, 50)
+    assert error['error'] == 'RuntimeError'
+    assert 'failed to converge' in error['message']
+    expected = batch.evaluate(dict(data, E=207e9))
+    for name in batch.outputs:
+        assert np.isnan(results[name][40:50]).all()
+        assert np.array_equal(results[name][:40], expected[name][:40])
+        assert np.array_equal(results[name][50:], expected[name][50:])
+
+
+def test_evaluate_executor():
+    data = make_data()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results, errors = parallel.evaluate(data, chunk_size=100,
+                                            executor=executor)
+        # The host's executor is not shut down
+        assert executor.submit(int, 1).result() == 1
+    assert np.array_equal(results['t_c'], batch.evaluate(data)['t_c'])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -2])
+def test_evaluate_invalid_chunk_size(chunk_size):
+    with pytest.raises(ValueError):
+        parallel.evaluate(make_data(), chunk_size=chunk_size)
@@ -125,3 +125,32 @@ def test_collapse_thickness(P_o, sig_y, E, v, D_o, f_0, expected):
 def test_buckle_thickness(D_o, P_p, sig_y, expected):
     assert abs(pd.buckle_thickness(
         D_o, P_p, sig_y) - expected) <= tol_pc * expected
+
+
+@pytest.mark.parametrize("P_o, sig_y, E, v, D_o, f_0, expected", [
+    (25.292e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-2, 3.260e-3),
+    (23.071e5, 450e6, 207e9, 0.3, 60.3e-3, 2.5e-2, 1.112316e-3),
+    (25.292e5, 370e6, 207e9, 0.3, 0.1683, 0, 2.981e-3),
+    # secant iterations from 1e-3 converge to a non-physical root
+    (43.22e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-3, 3.607e-3),
+])
+def test_collapse_thickness_bracket(P_o, sig_y, E, v, D_o, f_0, expected):
+    assert abs(pd.collapse_thickness(
+        P_o, sig_y, E, v, D_o, f_0, method='bracket') - expected) <= \
+        tol_pc * expected
+
+
+def test_collapse_thickness_warm_start():
+    args = (25.292e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-2)
+    t, cold = pd.collapse_thickness(*args, method='bracket',
+                                    full_output=True)
+    t_warm, warm = pd.collapse_thickness(*args, method='bracket',
+                                         x0=1.01 * t, full_output=True)
+    assert abs(t_warm - t) <= 1e-9
+    assert warm < cold
+
+
+def test_collapse_thickness_unknown_method():
+    with pytest.raises(ValueError):
+        pd.collapse_thickness(25.292e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-2,
+                              method='unknown')
@@ -0,0 +1,49 @@
+import pytest
+
+from wallthick import batch
+from wallthick import sensitivity
+from wallthick.cli import req_inputs
+
+from test_pd8010 import test_data
+
+tol_pc = 0.0001
+
+base = {key: test_data[0][key] for key in req_inputs}
+base['P_h'] = 1e5
+
+cases = [
+    base,
+    # thick wall hoop thickness
+    dict(base, D_o=0.05, P_d=60e6),
+    # strength test pressure limited by hoop stress
+    dict(base, P_d=30e6, t_sel=0.02),
+]
+
+
+@pytest.mark.parametrize("data", cases)
+@pytest.mark.parametrize("output", ['t_h', 't_c', 't_b', 'P_st'])
+def test_sensitivities_finite_difference(data, output):
+    results, jacobian = sensitivity.sensitivities(data)
+    assert set(jacobian[output]) == set(req_inputs)
+    for key in req_inputs:
+        step = 1e-6 * abs(data[key]) or 1e-9
+        up = batch.evaluate(dict(data, **{key: data[key] + step}))[output]
+        down = batch.evaluate(dict(data, **{key: data[key] - step}))[output]
+        expected = (up - down) / (2 * step)
+        scale = abs(results[output]) / abs(data[key] or 1)
+        assert abs(jacobian[output][key] - expected) <= \
+            tol_pc * max(abs(expected), scale)
+
+
+@pytest.mark.parametrize("outputs", [['t_h'], ['t_b', 'P_st'], ['P_lt']])
+def test_sensitivities_outputs(outputs):
+    data = {key: base[key] for key in batch.plan(outputs)}
+    results, jacobian = sensitivity.sensitivities(data, outputs=outputs)
+    expected, expected_jacobian = sensitivity.sensitivities(base)
+    assert sorted(results) == sorted(outputs)
+    assert sorted(jacobian) == sorted(set(outputs) - {'P_lt'})
+    for output in outputs:
+        assert results[output] == expected[output]
+    for output in jacobian:
+        for key in req_inputs:
+            assert jacobian[output][key] == expected_jacobian[output][key]
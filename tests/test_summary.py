@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import summary
+
+from test_pd8010 import test_data
+
+
+@pytest.fixture(scope='module')
+def results():
+    rng = np.random.RandomState(0)
+    n = 5000
+    data = dict(test_data[0])
+    data['D_o'] = rng.choice([0.1683, 0.3239, 0.61], n)
+    data['h'] = rng.uniform(10, 1500, n)
+    data['P_d'] = rng.uniform(1e6, 30e6, n)
+    return data['D_o'], batch.evaluate(data)
+
+
+def feed(results, chunks):
+    D_o, values = results
+    s = summary.Summary(k=5)
+    for part in np.array_split(np.arange(len(D_o)), chunks):
+        s.update({name: values[name][part] for name in summary.criteria},
+                 D_o[part], case_ids=part)
+    return s
+
+
+def test_governing(results):
+    _, values = results
+    s = feed(results, 1)
+    t = np.stack([values[name] for name in summary.criteria])
+    counts = np.bincount(np.argmax(t, axis=0), minlength=3)
+    assert s.cases == 5000
+    assert [s.governing[name] for name in summary.criteria] == list(counts)
+
+
+@pytest.mark.parametrize("q", [0, 1, 50, 95, 100])
+def test_percentile(results, q):
+    _, values = results
+    t_req = np.max([values[name] for name in summary.criteria], axis=0)
+    expected = np.percentile(t_req, q)
+    assert abs(feed(results, 7).percentile(q) - expected) <= 0.006 * expected
+
+
+def test_worst(results):
+    D_o, values = results
+    t_req = np.max([values[name] for name in summary.criteria], axis=0)
+    worst = feed(results, 7).report()['worst']
+    assert set(worst) == {168.3, 323.9, 610}
+    for size, items in worst.items():
+        members = np.flatnonzero(np.round(1000 * D_o, 1) == size)
+        expected = members[np.argsort(t_req[members])[::-1][:5]]
+        assert [case for _, case, _ in items] == list(expected)
+
+
+def test_merge(results):
+    D_o, values = results
+    half = len(D_o) // 2
+    parts = []
+    for part in (slice(None, half), slice(half, None)):
+        s = summary.Summary(k=5)
+        s.update({name: values[name][part] for name in summary.criteria},
+                 D_o[part], case_ids=np.arange(len(D_o))[part])
+        parts.append(s)
+    merged = parts[0].merge(parts[1])
+    assert merged.report() == feed(results, 1).report()
+
+
+def test_merge_different_bins():
+    with pytest.raises(ValueError):
+        summary.Summary().merge(summary.Summary(n_bins=10))
+
+
+def test_non_standard_and_invalid():
+    s = summary.Summary()
+    s.update({'t_h': np.array([0.01, np.nan]), 't_c': 0.005, 't_b': 0.002},
+             0.1)
+    report = s.report()
+    assert report['cases'] == 2
+    assert report['invalid'] == 1
+    assert report['worst'] == {None: [(0.01, 0, 't_h')]}
+
+
+def test_merge_start(results):
+    D_o, values = results
+    half = len(D_o) // 2
+    parts = []
+    for start, part in ((0, slice(None, half)), (half, slice(half, None))):
+        s = summary.Summary(k=5, start=start)
+        s.update({name: values[name][part] for name in summary.criteria},
+                 D_o[part])
+        parts.append(s)
+    merged = parts[0].merge(parts[1])
+    assert merged.report() == feed(results, 1).report()
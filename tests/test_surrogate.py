@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from wallthick import batch
+from wallthick import surrogate
+
+from test_pd8010 import test_data
+
+
+@pytest.fixture(scope='module')
+def table():
+    return surrogate.CollapseTable.build(n_k=101, n_g=101)
+
+
+@pytest.fixture
+def cases():
+    rng = np.random.RandomState(0)
+    n = 2000
+    return (rng.uniform(1e5, 4e7, n), rng.uniform(250e6, 500e6, n), 207e9,
+            0.3, rng.choice([0.1683, 0.3239, 0.61], n),
+            rng.uniform(1e-3, 3e-2, n))
+
+
+def test_build_max_error(table):
+    assert 0 < table.max_error < 0.05
+
+
+@pytest.mark.parametrize("rtol", [1e-2, 1e-3, 1e-6])
+def test_collapse_thickness_error_bound(table, cases, rtol):
+    exact = table.collapse_thickness(*cases, rtol=0)
+    approx = table.collapse_thickness(*cases, rtol=rtol)
+    assert np.all(np.abs(approx / exact - 1) <= rtol * (1 + 1e-6))
+
+
+@pytest.mark.parametrize("P_o, sig_y, E, v, D_o, f_0, expected", [
+    (25.292e5, 370e6, 207e9, 0.3, 0.1683, 2.5e-2, 3.260e-3),
+    (23.071e5, 450e6, 207e9, 0.3, 60.3e-3, 2.5e-2, 1.112316e-3),
+    # outside of the tabulated domain
+    (25.292e5, 370e6, 207e9, 0.3, 0.1683, 0, 2.981e-3),
+])
+def test_collapse_thickness(table, P_o, sig_y, E, v, D_o, f_0, expected):
+    assert abs(table.collapse_thickness(
+        P_o, sig_y, E, v, D_o, f_0) - expected) <= 1e-3 * expected
+
+
+def test_save_load(table, tmpdir):
+    path = str(tmpdir.join('table.npz'))
+    table.save(path)
+    loaded = surrogate.CollapseTable.load(path)
+    assert loaded.max_error == table.max_error
+    assert np.array_equal(loaded.log_ratio, table.log_ratio)
+
+
+def test_save_leaves_no_temporary_files(table, tmpdir):
+    table.save(str(tmpdir.join('table.npz')))
+    assert [p.basename for p in tmpdir.listdir()] == ['table.npz']
+
+
+def test_default_table_rebuilds_truncated_file(table, tmpdir, monkeypatch):
+    path = str(tmpdir.join('table.npz'))
+    table.save(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:len(data) // 2])
+    monkeypatch.setattr(surrogate, '_default_table', None)
+    monkeypatch.setattr(surrogate.CollapseTable, 'build',
+                        classmethod(lambda cls: table))
+    assert surrogate.default_table(path) is table
+    loaded = surrogate.CollapseTable.load(path)
+    assert np.array_equal(loaded.log_ratio, table.log_ratio)
+
+
+def test_evaluate_surrogate(table, monkeypatch):
+    monkeypatch.setattr(surrogate, '_default_table', table)
+    expected = batch.evaluate(test_data[0])['t_c']
+    result = batch.evaluate(test_data[0], method='surrogate')['t_c']
+    assert abs(result - expected) <= 1e-3 * expected
+
+
+def test_evaluate_unknown_method():
+    with pytest.raises(ValueError):
+        batch.evaluate(test_data[0], method='unknown')
@@ -39,6 +39,13 @@ sizes = {406.4: [4.8, 5.2, 5.6, 6.4, 7.1, 7.9, 8.7, 9.5, 10.3, 11.1, 11.9,
                15.9, 17.5, 19.1, 20.6, 22.2, 23.8, 25.4, 27, 28.6, 30.2, 31.8,
                33.3, 34.9]}
 
+"""Specified minimum yield strength [Pa] of API 5L PSL 2 line pipe grades,
+keyed by the grade names used by dnvf101.derate_material"""
+grades = {'CS X52': 360e6,
+          'CS X60': 415e6,
+          'CS X65': 450e6,
+          'CS X70': 485e6}
+
 
 def recommended_wall_thickness(D_o, req_wt):
     """Number [m], Number [m] -> Number [m]
@@ -49,17 +56,17 @@ def recommended_wall_thickness(D_o, req_wt):
     D_o_mm = 1000*D_o
     req_wt_mm = 1000*req_wt
 
-    try:
-        # Construct list of wall thicknesses greater than that required
-        acceptable_wt = [size for size in sizes[D_o_mm] if size >= req_wt_mm]
+    if D_o_mm not in sizes:
+        raise KeyError(
+            "Outside Diameter not standard API 5L size: {} mm".format(D_o_mm))
 
-        # Return minimum acceptable wall thickness as recommended in [m]
-        return 1e-3 * min(acceptable_wt)
+    # Construct list of wall thicknesses greater than that required
+    acceptable_wt = [size for size in sizes[D_o_mm] if size >= req_wt_mm]
 
-    except KeyError:
-        print("\nOutside Diameter not standard API 5L size")
-        raise
+    if not acceptable_wt:
+        raise ValueError(
+            "Required wall thickness greater than available API 5L sizes: "
+            "{} mm".format(req_wt_mm))
 
-    except ValueError:
-        print("\nRequired wall thickness greater than available API 5L sizes")
-        raise
+    # Return minimum acceptable wall thickness as recommended in [m]
+    return 1e-3 * min(acceptable_wt)
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+
+"""
+Vectorised PD 8010-2 calculations.
+
+Array counterparts of the calculations in wallthick.pd8010 for evaluating
+many cases in a single call. Inputs may be numbers or NumPy arrays and are
+broadcast against each other.
+"""
+
+import numpy as np
+
+from . import pd8010
+
+req_inputs = [
+    't_sel',
+    'f_tol',
+    'B',
+    't_corr',
+    'D_o',
+    'sig_y',
+    'sig_y_d',
+    'v',
+    'E',
+    'f_0',
+    'rho_w',
+    'h',
+    'H_t',
+    'H_w',
+    'P_d',
+    'P_h',
+    'g',
+    'f_s',
+]
+
+outputs = ['t_h', 't_c', 't_b', 'P_st', 'P_lt']
+
+# Inputs needed by each output, including those of its external pressures
+requires = {
+    't_h': ['P_d', 'P_h', 'rho_w', 'g', 'h', 'H_w', 'D_o', 'sig_y_d',
+            't_corr', 'f_tol'],
+    't_c': ['f_s', 'rho_w', 'g', 'h', 'H_t', 'H_w', 'sig_y_d', 'E', 'v',
+            'D_o', 'f_0'],
+    't_b': ['rho_w', 'g', 'h', 'H_t', 'H_w', 'D_o', 'sig_y_d'],
+    'P_st': ['t_sel', 'f_tol', 'sig_y', 'D_o', 'P_d', 'rho_w', 'g', 'h',
+             'H_w', 'P_h'],
+    'P_lt': ['P_d'],
+}
+
+
+def as_arrays(data, keys=None):
+    """Return a dict of broadcast float arrays for the given keys of data.
+
+    :param dict data: Input data, values are numbers or array-likes
+    :param list keys: Keys to convert, defaults to all keys in data
+    """
+    if keys is None:
+        keys = list(data)
+    arrays = np.broadcast_arrays(
+        *(np.asarray(data[key], dtype=float) for key in keys))
+    return dict(zip(keys, arrays))
+
+
+def input_arrays(data, keys):
+    """Return a dict of float arrays for the given keys of data, broadcast to
+    the shape of every Pd8010 input present in data.
+
+    Only the given keys are converted, but results computed from them have
+    the same shape as when every input is used.
+
+    :param dict data: Pd8010 input data, values are numbers or array-likes
+    :param list keys: Keys to convert, e.g. plan(outputs)
+    """
+    shape = np.broadcast(*(np.asarray(data[key]) for key in req_inputs
+                           if key in data)).shape
+    return {key: np.broadcast_to(np.asarray(data[key], dtype=float), shape)
+            for key in keys}
+
+
+def hoop_thickness(P_i, P_o_min, D_o, sig_y_d, n_s=pd8010.n_s):
+    """Return the minimum wall thickness [m] for internal pressure containment,
+    selecting thin or thick wall theory per case - PD8010-2 Equations (3) and
+    (5).
+
+    :param array P_i: Internal pressure [Pa]
+    :param array P_o_min: Minimum external pressure [Pa]
+    :param array D_o: Outside diameter [m]
+    :param array sig_y_d: De-rated yield strength [Pa]
+    :param array n_s: Allowable hoop stress factor [-]
+    """
+    delta_P = np.abs(P_i - P_o_min)
+    S = n_s * sig_y_d
+    t_thin = delta_P * D_o / (2 * S)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        thin = D_o / t_thin > 20
+        t_thick = 0.5 * D_o * (1 - np.sqrt((S - delta_P) / (S + delta_P)))
+    return np.where(thin, t_thin, t_thick)
+
+
+def hoop_pressure(t, D_o, P_o, sig):
+    """Return the internal pressure [Pa] that induces a stress, sig, selecting
+    thin or thick wall theory per case - PD8010-2 Equations (3) and (5).
+
+    :param array t: Wall thickness [m]
+    :param array D_o: Outside diameter [m]
+    :param array P_o: External pressure [Pa]
+    :param array sig: Stress [Pa]
+    """
+    with np.errstate(divide='ignore'):
+        thin = D_o / t > 20
+    return np.where(thin,
+                    pd8010.hoop_pressure_thin(t, D_o, P_o, sig),
+                    pd8010.hoop_pressure_thick(t, D_o, P_o, sig))
+
+
+def collapse_residual(t, P_o, sig_y_d, E, v, D_o, f_0):
+    """Return the PD8010-2 Equation (G.1) residual and its derivative with
+    respect to wall thickness as a tuple.
+
+    :param array t: Wall thickness [m]
+    :param array P_o: External pressure [Pa]
+    :param array sig_y_d: De-rated yield strength [Pa]
+    :param array E: Young's modulus [Pa]
+    :param array v: Poisson's ratio [-]
+    :param array D_o: Outside diameter [m]
+    :param array f_0: Pipeline ovality [-]
+    """
+    # P_o / P_e, P_o / P_y and the ovality term of Equation (G.1)
+    a = P_o * (1 - v**2) * D_o**3 / (2 * E * t**3)
+    b = P_o * D_o / (2 * sig_y_d * t)
+    c = b * f_0 * D_o / t
+    R = (a - 1) * (b**2 - 1) - c
+    dR_dt = (-3 * a * (b**2 - 1) - 2 * b**2 * (a - 1) + 2 * c) / t
+    return R, dR_dt
+
+
+def collapse_bracket(P_o, sig_y_d, E, v, D_o, f_0):
+    """Return lower and upper wall thicknesses [m] bracketing the physical root
+    of PD8010-2 Equation (G.1) as a tuple.
+
+    The lower bound is the elastic/plastic asymptote, where the external
+    pressure equals the larger of P_e and P_y. Above it the residual increases
+    monotonically from at most zero. Above the upper bound both pressure
+    ratios and the ovality term are at most 1/2, so the residual is positive.
+
+    :param array P_o: External pressure [Pa]
+    :param array sig_y_d: De-rated yield strength [Pa]
+    :param array E: Young's modulus [Pa]
+    :param array v: Poisson's ratio [-]
+    :param array D_o: Outside diameter [m]
+    :param array f_0: Pipeline ovality [-]
+    """
+    t_e = D_o * (P_o * (1 - v**2) / (2 * E))**(1 / 3)
+    t_y = P_o * D_o / (2 * sig_y_d)
+    lo = np.maximum(t_e, t_y)
+    hi = np.maximum(2 * lo, D_o * np.sqrt(P_o * f_0 / sig_y_d))
+    return lo, hi
+
+
+def collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0, method='bracket',
+                       x0=None, tol=1.48e-8, maxiter=50, full_output=False):
+    """Return the nominal wall thickness [m] for local buckling due to external
+    pressure - PD8010-2 Clause G.1.2.
+
+    Solves Equation (G.1) for every case simultaneously.
+
+    Solver methods:
+    - 'newton': Newton iterations from x0, default 1e-3 m, as
+        wallthick.pd8010.collapse_thickness does
+    - 'bracket': Newton iterations safeguarded by bisection within
+        collapse_bracket, starting from the lower bound or from x0, e.g. the
+        solution of neighbouring cases
+
+    :param array P_o: External pressure [Pa]
+    :param array sig_y_d: De-rated yield strength [Pa]
+    :param array E: Young's modulus [Pa]
+    :param array v: Poisson's ratio [-]
+    :param array D_o: Outside diameter [m]
+    :param array f_0: Pipeline ovality [-]
+    :param str method: Solver method, 'newton' or 'bracket'
+    :param array x0: Initial or previous wall thickness [m]
+    :param float tol: Absolute convergence tolerance on wall thickness [m]
+    :param int maxiter: Maximum number of iterations
+    :param bool full_output: Also return an array of the number of residual
+        evaluations per case
+    """
+    shape = np.broadcast(P_o, sig_y_d, E, v, D_o, f_0).shape
+    args = np.broadcast_arrays(*(np.atleast_1d(arg).astype(float) for arg in
+                                 (P_o, sig_y_d, E, v, D_o, f_0)))
+    size = args[0].shape
+    iterations = np.zeros(size, dtype=int)
+    active = np.ones(size, dtype=bool)
+
+    if method == 'newton':
+        t = np.array(np.broadcast_to(1e-3 if x0 is None else x0, size),
+                     dtype=float)
+        for _ in range(maxiter):
+            R, dR_dt = collapse_residual(t[active],
+                                         *(a[active] for a in args))
+            iterations[active] += 1
+            step = R / dR_dt
+            t[active] -= step
+            active[active] = ~(np.abs(step) <= tol)
+            if not active.any():
+                break
+    elif method == 'bracket':
+        lo, hi = collapse_bracket(*args)
+        if x0 is None:
+            t = lo.copy()
+        else:
+            x0 = np.broadcast_to(x0, size)
+            t = np.where(np.isnan(x0), lo, np.clip(x0, lo, hi))
+        for _ in range(maxiter):
+            sub = [a[active] for a in args]
+            t_a, lo_a, hi_a = t[active], lo[active], hi[active]
+            R, dR_dt = collapse_residual(t_a, *sub)
+            iterations[active] += 1
+            lo_a = np.where(R <= 0, t_a, lo_a)
+            hi_a = np.where(R <= 0, hi_a, t_a)
+            # Newton step, bisecting the bracket if the step leaves it
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_new = t_a - R / dR_dt
+            outside = ~((t_new > lo_a) & (t_new < hi_a))
+            t_new = np.where(outside, 0.5 * (lo_a + hi_a), t_new)
+            t_new = np.where(R == 0, t_a, t_new)
+            t[active], lo[active], hi[active] = t_new, lo_a, hi_a
+            active[active] = ~((np.abs(t_new - t_a) <= tol) | (R == 0))
+            if not active.any():
+                break
+    else:
+        raise ValueError("Unknown collapse method: {}".format(method))
+
+    if active.any():
+        raise RuntimeError(
+            "Collapse thickness failed to converge after {} iterations for "
+            "{} case(s).".format(maxiter, np.count_nonzero(active)))
+    if full_output:
+        return t.reshape(shape), iterations.reshape(shape)
+    return t.reshape(shape)
+
+
+class CollapseSolver(object):
+    """A warm-started collapse thickness solver.
+
+    Each call is started from the previous solution, scaled by outside
+    diameter, so cases processed in sorted or neighbouring order, e.g. along a
+    route or through a parameter sweep, converge in fewer iterations. Array
+    solutions are reused element by element for calls of the same shape.
+    """
+
+    def __init__(self, method='bracket', **kwargs):
+        self.method = method
+        self.kwargs = kwargs
+        self.tau = None
+        self.iterations = 0
+        self.cases = 0
+
+    def __call__(self, P_o, sig_y_d, E, v, D_o, f_0):
+        """Return the collapse thickness [m] - see collapse_thickness.
+        """
+        shape = np.broadcast(P_o, sig_y_d, E, v, D_o, f_0).shape
+        x0 = None
+        if self.tau is not None and self.tau.shape in (shape, ()):
+            x0 = self.tau * D_o
+        t, iterations = collapse_thickness(
+            P_o, sig_y_d, E, v, D_o, f_0, method=self.method, x0=x0,
+            full_output=True, **self.kwargs)
+        self.tau = t / D_o
+        self.iterations += int(np.sum(iterations))
+        self.cases += iterations.size
+        return t
+
+    @property
+    def mean_iterations(self):
+        """Mean number of residual evaluations per case solved.
+        """
+        return self.iterations / self.cases if self.cases else 0.0
+
+
+def strength_test_pressure(t_sel, f_tol, sig_y, D_o, P_d, P_o, P_h):
+    """Return the strength test pressure [Pa], i.e. the minimum of 1.5 * design
+    pressure plus head and the pressure that induces a hoop stress of 90
+    percent SMYS at nominal wall thickness - PD8010-2 Section 11.5.1.
+
+    :param array t_sel: Selected wall thickness [m]
+    :param array f_tol: fabrication tolerance [-]
+    :param array sig_y: Yield strength [Pa]
+    :param array D_o: Outside Diameter [m]
+    :param array P_d: Design pressure [Pa]
+    :param array P_o: External pressure [Pa]
+    :param array P_h: Pressure head [Pa]
+    """
+    t_min = t_sel * (1 - f_tol)
+    P_hoop = hoop_pressure(t_min, D_o, P_o, 0.9 * sig_y)
+    P_test = 1.5 * P_d + P_h
+    return np.minimum(P_hoop, P_test)
+
+
+def plan(outputs=None):
+    """Return the list of inputs, in req_inputs order, needed to evaluate the
+    given outputs.
+
+    :param list outputs: Output names, defaults to all outputs
+    """
+    if outputs is None:
+        outputs = list(requires)
+    if not outputs:
+        raise ValueError("No outputs selected")
+    unknown = [name for name in outputs if name not in requires]
+    if unknown:
+        raise ValueError("Unknown outputs: {}".format(', '.join(unknown)))
+    needed = set(key for name in outputs for key in requires[name])
+    return [key for key in req_inputs if key in needed]
+
+
+def evaluate(data, method='bracket', outputs=None):
+    """Return a dict of arrays of the PD 8010-2 outputs (t_h, t_c, t_b, P_st
+    and P_lt) for every case in data.
+
+    Equivalent to evaluating the Pd8010 properties case by case. When outputs
+    is given, only those outputs are evaluated, along with the external
+    pressures and solvers they depend on, and only the inputs listed by
+    plan(outputs) need to be present in data. Selecting outputs other than
+    t_c skips the collapse thickness root solve.
+
+    :param dict data: Pd8010 input data, values are numbers or arrays
+    :param str method: Collapse thickness method, 'newton' or 'bracket' to
+        solve every case (see collapse_thickness) or 'surrogate' to use
+        wallthick.surrogate.collapse_thickness
+    :param list outputs: Output names to evaluate, defaults to all outputs
+    """
+    if outputs is None:
+        outputs = list(requires)
+    keys = plan(outputs)
+    if 't_c' in outputs:
+        if method == 'surrogate':
+            from . import surrogate
+            collapse = surrogate.collapse_thickness
+        else:
+            def collapse(*args):
+                return collapse_thickness(*args, method=method)
+
+    d = input_arrays(data, keys)
+
+    # The minimum water depth does not depend on tide height
+    if {'t_h', 'P_st'} & set(outputs):
+        d_min = pd8010.water_depths(d['h'], 0, d['H_w'])[0]
+        P_o_min = pd8010.external_pressure(d['rho_w'], d['g'], d_min)
+    if {'t_c', 't_b'} & set(outputs):
+        d_max = pd8010.water_depths(d['h'], d['H_t'], d['H_w'])[1]
+        P_o_max = pd8010.external_pressure(d['rho_w'], d['g'], d_max)
+
+    results = {}
+    for name in outputs:
+        if name == 't_h':
+            P_i = pd8010.internal_pressure(d['P_d'], d['P_h'])
+            t_h_min = hoop_thickness(P_i, P_o_min, d['D_o'], d['sig_y_d'])
+            results['t_h'] = (t_h_min + d['t_corr']) / (1 - d['f_tol'])
+        elif name == 't_c':
+            results['t_c'] = collapse(
+                d['f_s'] * P_o_max, d['sig_y_d'], d['E'], d['v'], d['D_o'],
+                d['f_0'])
+        elif name == 't_b':
+            results['t_b'] = pd8010.buckle_thickness(
+                d['D_o'], P_o_max, d['sig_y_d'])
+        elif name == 'P_st':
+            results['P_st'] = strength_test_pressure(
+                d['t_sel'], d['f_tol'], d['sig_y'], d['D_o'], d['P_d'],
+                P_o_min, d['P_h'])
+        elif name == 'P_lt':
+            results['P_lt'] = 1.1 * d['P_d']
+    return results
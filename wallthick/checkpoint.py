@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checkpointed batch calculations.
+
+A batch run is split into chunks of cases. Each completed chunk is written to
+its own file in a checkpoint directory beside the output file, and a manifest
+recording the completed chunks is updated after every chunk. Both are written
+atomically, so an interrupted run can be resumed from the last completed
+chunk. The manifest is keyed to a hash of the input file, the chunk size and
+the selected outputs, so a checkpoint is never resumed against different
+inputs.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from . import batch
+
+MANIFEST = 'manifest.json'
+
+
+def input_hash(raw):
+    """Return the SHA-256 hex digest of the raw input file contents.
+
+    :param bytes raw: Input file contents
+    """
+    return hashlib.sha256(raw).hexdigest()
+
+
+def checkpoint_dir(output):
+    """Return the checkpoint directory for an output file.
+
+    :param str output: Output file path
+    """
+    return output + '.ckpt'
+
+
+def _write_atomic(path, write):
+    """Write a file by calling write(f) on a temporary file in the same
+    directory, then renaming it over path.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                               prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _write_manifest(path, manifest):
+    _write_atomic(os.path.join(path, MANIFEST),
+                  lambda f: json.dump(manifest, f))
+
+
+def _chunk_file(path, index):
+    return os.path.join(path, 'chunk-{:06d}.csv'.format(index))
+
+
+def _write_chunk(f, start, results, outputs):
+    case = np.arange(start, start + len(results[outputs[0]]))
+    np.savetxt(f, np.column_stack(
+        [case] + [results[name] for name in outputs]),
+        fmt=['%d'] + ['%.10g'] * len(outputs), delimiter=',')
+
+
+def load_manifest(output):
+    """Return the checkpoint manifest for an output file, or None if there is
+    no checkpoint.
+
+    :param str output: Output file path
+    """
+    try:
+        with open(os.path.join(checkpoint_dir(output), MANIFEST)) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def resumable(manifest, key, chunk_size, outputs=None):
+    """Return True if a checkpoint manifest can be resumed by a run with the
+    given input hash, chunk size and outputs.
+
+    :param dict manifest: Checkpoint manifest, see load_manifest, or None
+    :param str key: Input file hash, see input_hash
+    :param int chunk_size: Number of cases per chunk
+    :param list outputs: Outputs to evaluate, defaults to all outputs
+    """
+    if outputs is None:
+        outputs = batch.outputs
+    return (manifest is not None and manifest['input_hash'] == key and
+            manifest['chunk_size'] == chunk_size and
+            manifest.get('outputs', batch.outputs) == list(outputs))
+
+
+def run(cases, output, key, chunk_size=10000, resume=False, progress=None,
+        outputs=None):
+    """Evaluate a list of cases in chunks, checkpointing after each chunk, and
+    write the PD 8010-2 outputs to a CSV file. Return the number of chunks
+    evaluated by this call.
+
+    :param list cases: Pd8010 input data dicts
+    :param str output: Output CSV file path
+    :param str key: Input file hash, see input_hash
+    :param int chunk_size: Number of cases per chunk, at least one
+    :param bool resume: Skip chunks completed by a previous run with the same
+        input file and chunk size
+    :param callable progress: Called with (completed, total) chunks after
+        every chunk
+    :param list outputs: Outputs to evaluate and write, defaults to all
+        outputs - see batch.evaluate
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            "chunk_size must be at least 1, got {}".format(chunk_size))
+    if outputs is None:
+        outputs = batch.outputs
+    outputs = list(outputs)
+    inputs = batch.plan(outputs)
+    path = checkpoint_dir(output)
+    n_chunks = -(-len(cases) // chunk_size)
+    manifest = load_manifest(output) if resume else None
+    if not resumable(manifest, key, chunk_size, outputs):
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+        manifest = {'input_hash': key, 'chunk_size': chunk_size,
+                    'outputs': outputs, 'cases': len(cases), 'completed': []}
+        _write_manifest(path, manifest)
+    completed = set(manifest['completed'])
+
+    evaluated = 0
+    for index in range(n_chunks):
+        if index in completed:
+            continue
+        start = index * chunk_size
+        chunk = cases[start:start + chunk_size]
+        data = {name: np.array([case[name] for case in chunk], dtype=float)
+                for name in inputs}
+        results = batch.evaluate(data, outputs=outputs)
+        _write_atomic(_chunk_file(path, index),
+                      lambda f: _write_chunk(f, start, results, outputs))
+        completed.add(index)
+        manifest['completed'] = sorted(completed)
+        _write_manifest(path, manifest)
+        evaluated += 1
+        if progress is not None:
+            progress(len(completed), n_chunks)
+
+    def write_output(f):
+        f.write(','.join(['case'] + outputs) + '\n')
+        for index in range(n_chunks):
+            with open(_chunk_file(path, index)) as chunk:
+                shutil.copyfileobj(chunk, f)
+
+    _write_atomic(output, write_output)
+    shutil.rmtree(path)
+    return evaluated
@@ -7,27 +7,9 @@ import click
 import json
 
 import wallthick
-
-req_inputs = [
-    't_sel',
-    'f_tol',
-    'B',
-    't_corr',
-    'D_o',
-    'sig_y',
-    'sig_y_d',
-    'v',
-    'E',
-    'f_0',
-    'rho_w',
-    'h',
-    'H_t',
-    'H_w',
-    'P_d',
-    'P_h',
-    'g',
-    'f_s',
-]
+from wallthick import checkpoint
+from wallthick import batch
+from wallthick.batch import req_inputs
 
 
 @click.command()
@@ -53,3 +35,56 @@ def main(inputs):
         click.secho(
             f'Check input data file includes all of the following: {req_inputs}', fg='red')
     return 0
+
+
+@click.command()
+@click.argument('inputs', type=click.File('rb'))
+@click.argument('output', type=click.Path(dir_okay=False))
+@click.option('--chunk-size', default=10000, show_default=True,
+              type=click.IntRange(min=1),
+              help='Number of cases per checkpointed chunk.')
+@click.option('--resume', is_flag=True,
+              help='Resume an interrupted run from its checkpoint.')
+@click.option('--outputs', default=','.join(batch.outputs), show_default=True,
+              help='Comma separated outputs to calculate.')
+def run_batch(inputs, output, chunk_size, resume, outputs):
+    """Console script for batches of wallthick calculations.
+
+    Runs a JSON file containing a list of cases and writes the results to an
+    OUTPUT CSV file, checkpointing progress after every chunk of cases. Only
+    the calculations needed for the selected outputs are run.
+    """
+    outputs = [name.strip() for name in outputs.split(',') if name.strip()]
+    try:
+        required = batch.plan(outputs)
+    except ValueError as e:
+        raise click.BadParameter(
+            f'{e}. Choose from: {", ".join(batch.outputs)}',
+            param_hint='--outputs')
+    raw = inputs.read()
+    cases = json.loads(raw.decode('utf-8'))
+    if all(param in case for case in cases for param in required):
+        click.secho(
+            f'Running PD 8010-2 wall thickness calculation for {len(cases)} cases...', fg='green')
+        key = checkpoint.input_hash(raw)
+        manifest = checkpoint.load_manifest(output) if resume else None
+        if manifest is not None:
+            if checkpoint.resumable(manifest, key, chunk_size, outputs):
+                click.echo(
+                    f'Resuming: {len(manifest["completed"])} chunks complete.')
+            else:
+                click.secho(
+                    'Discarding checkpoint from a run with different inputs, '
+                    'chunk size or outputs.', fg='yellow')
+
+        def progress(completed, total):
+            click.echo(f'Chunk {completed} of {total} complete.')
+
+        checkpoint.run(cases, output, key, chunk_size=chunk_size,
+                       resume=resume, progress=progress, outputs=outputs)
+        click.echo(f'Results written to {output}')
+    else:
+        click.secho('Calculation not ran.\n', fg='red')
+        click.secho(
+            f'Check every case in the input data file includes all of the following: {required}', fg='red')
+    return 0
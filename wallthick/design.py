@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Minimum weight line pipe selection.
+
+Searches every API 5L outside diameter, standard wall thickness and material
+grade for line pipe satisfying a required flow area and the PD 8010-2 wall
+thickness criteria, and returns the Pareto set of steel mass against wall
+thickness margin.
+"""
+
+import numpy as np
+
+from . import api5l
+from . import batch
+from . import dnvf101
+
+rho_s = 7850
+
+
+def search(data, A_req, temp, grades=None):
+    """Return the Pareto set of line pipe with the least steel mass for a given
+    wall thickness margin, ordered by increasing mass.
+
+    The required wall thickness, max(t_h, t_c, t_b), does not depend on the
+    selected wall, so it is evaluated once per outside diameter and grade in a
+    single vectorised call. Standard walls are sorted, so the walls meeting it
+    and the flow area requirement form a contiguous range located by binary
+    search without evaluating the walls outside it.
+
+    The result is a dict of arrays with entries:
+    - 'D_o': Outside diameter [m]
+    - 't_sel': Selected wall thickness [m]
+    - 'grade': Material grade
+    - 'sig_y_d': De-rated yield strength [Pa]
+    - 't_req': Required wall thickness [m]
+    - 'governing': Governing criterion, 't_h', 't_c' or 't_b'
+    - 'mass': Steel mass per unit length [kg/m]
+    - 'margin': Wall thickness margin, t_sel / t_req - 1 [-]
+
+    :param dict data: Pd8010 input data, D_o and sig_y_d are set by the
+        search and t_sel and sig_y are not needed
+    :param float A_req: Required internal flow area [m^2]
+    :param float temp: Design temperature [degC]
+    :param dict grades: Yield strength [Pa] by grade, defaults to api5l.grades
+    """
+    if grades is None:
+        grades = api5l.grades
+
+    sizes = sorted(api5l.sizes)
+    names = list(grades)
+    D_o_mm, grade = (a.ravel() for a in np.meshgrid(
+        sizes, np.arange(len(names)), indexing='ij'))
+    D_o = 1e-3 * D_o_mm
+    sig_y_d = np.array([dnvf101.derate_material(name, grades[name], temp)
+                        for name in names])
+
+    results = batch.evaluate(dict(data, D_o=D_o, sig_y_d=sig_y_d[grade]),
+                             outputs=['t_h', 't_c', 't_b'])
+    t = np.stack([results[name] for name in ('t_h', 't_c', 't_b')])
+    governing = np.argmax(t, axis=0)
+    t_req = t.max(axis=0)
+    # Thickest wall leaving the required flow area
+    t_max = 0.5 * (D_o - np.sqrt(4 * A_req / np.pi))
+
+    candidates = []
+    for i, size in enumerate(D_o_mm):
+        walls = 1e-3 * np.array(api5l.sizes[size])
+        lo = np.searchsorted(walls, t_req[i] - 1e-12)
+        hi = np.searchsorted(walls, t_max[i] + 1e-12, side='right')
+        if lo < hi:
+            candidates.append((np.full(hi - lo, i), walls[lo:hi]))
+    if not candidates:
+        index, t_sel = np.zeros(0, dtype=int), np.zeros(0)
+    else:
+        index, t_sel = (np.concatenate(a) for a in zip(*candidates))
+
+    mass = rho_s * np.pi * (D_o[index] - t_sel) * t_sel
+    margin = t_sel / t_req[index] - 1
+
+    # Keep candidates with a greater margin than every lighter candidate
+    order = np.lexsort((-margin, mass))
+    best = np.maximum.accumulate(margin[order])
+    keep = order[np.concatenate(([True], best[1:] > best[:-1]))[:len(order)]]
+    index = index[keep]
+    return {
+        'D_o': D_o[index],
+        't_sel': t_sel[keep],
+        'grade': np.array(names, dtype=object)[grade[index]],
+        'sig_y_d': sig_y_d[grade[index]],
+        't_req': t_req[index],
+        'governing': np.array(['t_h', 't_c', 't_b'])[governing[index]],
+        'mass': mass[keep],
+        'margin': margin[keep],
+    }
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pandas and Arrow interfaces to the vectorised PD 8010-2 calculations.
+
+Cases are read from columns named after wallthick.batch.req_inputs and
+evaluated directly on the column buffers, without building a Pd8010 object
+or dict per row. Both pandas and pyarrow are optional dependencies.
+"""
+
+from . import batch
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+def _check_columns(columns, inputs):
+    missing = [name for name in inputs if name not in columns]
+    if missing:
+        raise KeyError(
+            "Missing input columns: {}".format(', '.join(missing)))
+
+
+def evaluate_frame(df, method='bracket', outputs=None):
+    """Return a copy of a pandas DataFrame with the PD 8010-2 outputs (t_h,
+    t_c, t_b, P_st and P_lt) appended as new columns.
+
+    Float columns are passed to the calculation as views of their underlying
+    buffers.
+
+    :param DataFrame df: Input data, one case per row
+    :param str method: Collapse thickness method - see batch.evaluate
+    :param list outputs: Outputs to append, defaults to all outputs - see
+        batch.evaluate
+    """
+    if pandas is None:  # pragma: no cover
+        raise ImportError("evaluate_frame requires pandas")
+    if outputs is None:
+        outputs = batch.outputs
+    inputs = batch.plan(outputs)
+    _check_columns(df.columns, inputs)
+    data = {name: df[name].to_numpy() for name in inputs}
+    results = batch.evaluate(data, method=method, outputs=outputs)
+    return df.assign(**{name: results[name] for name in outputs})
+
+
+def evaluate_table(table, method='bracket', outputs=None):
+    """Return a pyarrow Table with the PD 8010-2 outputs (t_h, t_c, t_b, P_st
+    and P_lt) appended as new columns.
+
+    The table is evaluated one record batch at a time on zero-copy NumPy
+    views of its float columns. The input columns are shared with the
+    returned table, not copied.
+
+    :param Table table: Input data, one case per row
+    :param str method: Collapse thickness method - see batch.evaluate
+    :param list outputs: Outputs to append, defaults to all outputs - see
+        batch.evaluate
+    """
+    if pyarrow is None:  # pragma: no cover
+        raise ImportError("evaluate_table requires pyarrow")
+    if outputs is None:
+        outputs = batch.outputs
+    inputs = batch.plan(outputs)
+    _check_columns(table.column_names, inputs)
+    chunks = {name: [] for name in outputs}
+    for record_batch in table.select(inputs).to_batches():
+        data = {name: record_batch.column(i).to_numpy(zero_copy_only=False)
+                for i, name in enumerate(record_batch.schema.names)}
+        results = batch.evaluate(data, method=method, outputs=outputs)
+        for name in outputs:
+            chunks[name].append(pyarrow.array(results[name]))
+    for name in outputs:
+        table = table.append_column(
+            name, pyarrow.chunked_array(chunks[name], type=pyarrow.float64()))
+    return table
+
+
+def evaluate_arrays(table, method='bracket', outputs=None):
+    """Return a dict of pyarrow ChunkedArrays of the PD 8010-2 outputs for
+    every row of a pyarrow Table.
+
+    :param Table table: Input data, one case per row
+    :param str method: Collapse thickness method - see batch.evaluate
+    :param list outputs: Outputs to evaluate, defaults to all outputs - see
+        batch.evaluate
+    """
+    if outputs is None:
+        outputs = batch.outputs
+    inputs = batch.plan(outputs)
+    _check_columns(table.column_names, inputs)
+    results = evaluate_table(table.select(inputs), method=method,
+                             outputs=outputs)
+    return {name: results.column(name) for name in outputs}
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+Hydrotest section planning along an elevation profile.
+
+PD8010-2 Section 11.5.1 requires every point of a test section to see at least
+1.5 times the design pressure while the hoop stress stays below 90 percent
+SMYS. The pressure at a point is the pressure at the section high point plus
+the static head of the test water, so a long section with a large change in
+elevation cannot satisfy both limits. plan_sections splits a profile into the
+minimum number of sections that can.
+"""
+
+import numpy as np
+
+from . import batch
+from . import pd8010
+
+
+def pressure_limits(t_sel, f_tol, sig_y, D_o, P_d, P_o):
+    """Return the minimum and maximum allowable strength test pressure [Pa] at
+    a point as a tuple, i.e. 1.5 * design pressure and the pressure that
+    induces a hoop stress of 90 percent SMYS at nominal wall thickness.
+
+    :param array t_sel: Selected wall thickness [m]
+    :param array f_tol: Fabrication tolerance [-]
+    :param array sig_y: Yield strength [Pa]
+    :param array D_o: Outside diameter [m]
+    :param array P_d: Design pressure [Pa]
+    :param array P_o: External pressure [Pa]
+    """
+    t_min = t_sel * (1 - f_tol)
+    P_hoop = batch.hoop_pressure(t_min, D_o, P_o, 0.9 * sig_y)
+    return 1.5 * P_d, P_hoop
+
+
+def _section_end(lo, hi, start, window=256):
+    """Return the end index (exclusive) of the longest feasible section
+    starting at start, i.e. for which max(lo) <= min(hi).
+    """
+    n = len(lo)
+    end = start
+    lo_max, hi_min = -np.inf, np.inf
+    while end < n:
+        lo_run = np.maximum(np.maximum.accumulate(lo[end:end + window]),
+                            lo_max)
+        hi_run = np.minimum(np.minimum.accumulate(hi[end:end + window]),
+                            hi_min)
+        fail = lo_run > hi_run
+        if fail.any():
+            return end + int(np.argmax(fail))
+        lo_max, hi_min = lo_run[-1], hi_run[-1]
+        end += len(lo_run)
+        window *= 2
+    return n
+
+
+def plan_sections(kp, z, t_sel, f_tol, sig_y, D_o, P_d, d=0, rho_t=1027,
+                  rho_w=1027, g=9.81):
+    """Return a hydrotest plan splitting a pipeline profile into the minimum
+    number of strength test sections.
+
+    Each section is tested at the lowest pressure giving at least 1.5 * design
+    pressure at every point, i.e. 1.5 * design pressure at its high point for
+    a constant design pressure. The pressure at any other point is that plus
+    the test water head. A section is feasible if no point then exceeds 90
+    percent SMYS hoop stress. Sections are grown greedily from the start of
+    the route, which gives the minimum number of sections because any part of
+    a feasible section is feasible.
+
+    The plan is a dict with entries:
+    - 'start', 'end': Point index of the start and end (exclusive) of each
+        section
+    - 'kp_start', 'kp_end': KP [m] of the first and last point of each section
+    - 'P_test': Strength test pressure [Pa] at the high point of each section
+    - 'section': Section index of each point
+    - 'P_h': Test water head [Pa] at each point relative to its section high
+        point
+    - 'P_st': Strength test pressure [Pa] at each point
+    - 'P_min', 'P_max': Minimum and maximum allowable test pressure [Pa] at
+        each point
+
+    :param array kp: Kilometre point of each point along the route [m]
+    :param array z: Elevation of each point [m]
+    :param array t_sel: Selected wall thickness [m]
+    :param array f_tol: Fabrication tolerance [-]
+    :param array sig_y: Yield strength [Pa]
+    :param array D_o: Outside diameter [m]
+    :param array P_d: Design pressure [Pa]
+    :param array d: Water depth [m]
+    :param float rho_t: Test water density [kg/m^3]
+    :param float rho_w: Sea water density [kg/m^3]
+    :param float g: Acceleration of gravity [m/s/s]
+    """
+    kp = np.asarray(kp, dtype=float)
+    z = np.asarray(z, dtype=float)
+    P_o = pd8010.external_pressure(rho_w, g, np.asarray(d, dtype=float))
+    P_min, P_max = pressure_limits(t_sel, f_tol, sig_y, D_o, P_d, P_o)
+    z, P_min, P_max = np.broadcast_arrays(z, P_min, P_max)
+
+    infeasible = P_min > P_max
+    if infeasible.any():
+        raise ValueError(
+            "1.5 * design pressure exceeds 90 percent SMYS hoop stress at "
+            "KP {:.1f} m".format(kp[np.argmax(infeasible)]))
+
+    # Allowable pressures referred to zero elevation
+    head = rho_t * g * z
+    lo = P_min + head
+    hi = P_max + head
+
+    starts = [0]
+    while True:
+        end = _section_end(lo, hi, starts[-1])
+        if end == len(z):
+            break
+        starts.append(end)
+    start = np.array(starts)
+    end = np.append(start[1:], len(z))
+
+    section = np.repeat(np.arange(len(start)), end - start)
+    datum = np.maximum.reduceat(lo, start)
+    z_top = np.maximum.reduceat(z, start)
+    P_h = rho_t * g * (z_top[section] - z)
+    return {
+        'start': start,
+        'end': end,
+        'kp_start': kp[start],
+        'kp_end': kp[end - 1],
+        'P_test': datum - rho_t * g * z_top,
+        'section': section,
+        'P_h': P_h,
+        'P_st': datum[section] - head,
+        'P_min': P_min,
+        'P_max': P_max,
+    }
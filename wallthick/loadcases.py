@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Multi-phase load case evaluation.
+
+A pipe passes through several phases, e.g. empty installation, flooded
+hydrotest and operation, each with its own internal pressure, temperature and
+relevant criteria. Here the pipe geometry, material and environment are
+defined once and every phase is evaluated against them together, sharing the
+water depths, external pressures, de-rated yield strengths and collapse and
+buckle solutions between phases.
+"""
+
+import numpy as np
+
+from . import batch
+from . import dnvf101
+from . import pd8010
+
+criteria = ['t_h', 't_c', 't_b']
+
+# Empty during installation, so collapse and buckle propagation only
+installation = {'criteria': ['t_c', 't_b']}
+
+
+def hydrotest(P_st, P_h=0):
+    """Return a hydrotest phase at strength test pressure P_st [Pa] and pressure
+    head P_h [Pa]. The test is on new pipe, so without corrosion allowance.
+    """
+    return {'P_d': P_st, 'P_h': P_h, 'n_s': 0.9, 'derate': False,
+            'corrosion': False, 'criteria': ['t_h']}
+
+
+def operation(P_d, temp, P_h=0):
+    """Return an operation phase at design pressure P_d [Pa], pressure head
+    P_h [Pa] and design temperature temp [degC].
+    """
+    return {'P_d': P_d, 'P_h': P_h, 'temp': temp,
+            'criteria': ['t_h', 't_c', 't_b']}
+
+
+def _key(value):
+    value = np.asarray(value, dtype=float)
+    return value.shape, value.tobytes()
+
+
+def evaluate(data, phases):
+    """Return the required wall thicknesses of every pipe in every phase and
+    their envelope.
+
+    data holds the Pd8010 inputs shared by all phases; P_d and P_h are
+    ignored. Each phase is a dict of:
+    - 'criteria': List of criteria to evaluate, from 't_h', 't_c' and 't_b'
+    - 'P_d', 'P_h': Design pressure and pressure head [Pa], default zero
+    - 'temp': Temperature [degC] at which sig_y is de-rated with
+        dnvf101.derate_material for data['grade']; otherwise
+        data['sig_y_d'] is used
+    - 'derate': False to use the un-derated yield strength, sig_y
+    - 'n_s': Allowable hoop stress factor, default pd8010.n_s
+    - 'corrosion': False to exclude the corrosion allowance, t_corr, from
+        the required hoop thickness, e.g. for a strength test of new pipe
+
+    The result is a dict of:
+    - 'phases': Dict of phase name to dict of criterion to thickness [m]
+    - 't_gov': Governing required wall thickness of each pipe [m]
+    - 'phase': Name of the governing phase of each pipe
+    - 'criterion': Name of the governing criterion of each pipe
+
+    :param dict data: Pd8010 input data, values are numbers or arrays
+    :param dict phases: Phase definitions by name
+    """
+    if not phases:
+        raise ValueError("At least one phase is required")
+    grade = data.get('grade')
+    derated = [name for name, phase in phases.items()
+               if phase.get('derate', True) and 'temp' in phase]
+    if derated and grade is None:
+        raise ValueError(
+            "Input data must include 'grade' to de-rate the yield strength "
+            "for phases: {}".format(', '.join(derated)))
+    d = batch.as_arrays(data, [key for key in batch.req_inputs
+                               if key not in ('P_d', 'P_h')])
+    shape = d['D_o'].shape
+
+    # Shared by every phase
+    d_min, d_max = pd8010.water_depths(d['h'], d['H_t'], d['H_w'])
+    P_o_min = pd8010.external_pressure(d['rho_w'], d['g'], d_min)
+    P_o_max = pd8010.external_pressure(d['rho_w'], d['g'], d_max)
+    P_o_c = d['f_s'] * P_o_max
+
+    # De-rated yield strength per phase, computed once per temperature
+    yields = {}
+    sig_y_d = {}
+    for name, phase in phases.items():
+        if not phase.get('derate', True):
+            sig = d['sig_y']
+        elif 'temp' in phase:
+            key = _key(phase['temp'])
+            if key not in yields:
+                yields[key] = np.broadcast_to(dnvf101.derate_material(
+                    grade, d['sig_y'], phase['temp']), shape)
+            sig = yields[key]
+        else:
+            sig = d['sig_y_d']
+        sig_y_d[name] = sig
+
+    results = {name: {} for name in phases}
+
+    # Pressure containment, all phases in one call
+    hoop = [name for name, phase in phases.items()
+            if 't_h' in phase['criteria']]
+    if hoop:
+        P_i = np.stack([np.broadcast_to(pd8010.internal_pressure(
+            phases[name].get('P_d', 0), phases[name].get('P_h', 0)), shape)
+            for name in hoop])
+        n_s = np.array([phases[name].get('n_s', pd8010.n_s)
+                        for name in hoop]).reshape((-1,) + (1,) * len(shape))
+        corrosion = np.array([phases[name].get('corrosion', True)
+                              for name in hoop]).reshape(n_s.shape)
+        sig = np.stack([sig_y_d[name] for name in hoop])
+        t_min = batch.hoop_thickness(P_i, P_o_min, d['D_o'], sig, n_s)
+        t_h = (t_min + corrosion * d['t_corr']) / (1 - d['f_tol'])
+        for i, name in enumerate(hoop):
+            results[name]['t_h'] = t_h[i]
+
+    # Collapse and buckle propagation, solved once per distinct yield strength
+    external = [name for name, phase in phases.items()
+                if {'t_c', 't_b'} & set(phase['criteria'])]
+    unique = {}
+    for name in external:
+        unique.setdefault(_key(sig_y_d[name]), sig_y_d[name])
+    if unique:
+        keys = list(unique)
+        sig = np.stack([unique[key] for key in keys])
+        t_c = batch.collapse_thickness(P_o_c, sig, d['E'], d['v'], d['D_o'],
+                                       d['f_0'])
+        t_b = pd8010.buckle_thickness(d['D_o'], P_o_max, sig)
+        for name in external:
+            i = keys.index(_key(sig_y_d[name]))
+            if 't_c' in phases[name]['criteria']:
+                results[name]['t_c'] = t_c[i]
+            if 't_b' in phases[name]['criteria']:
+                results[name]['t_b'] = t_b[i]
+
+    # Envelope over every phase and criterion
+    labels = [(name, criterion) for name in phases
+              for criterion in criteria if criterion in results[name]]
+    t = np.stack([results[name][criterion] for name, criterion in labels])
+    index = np.argmax(t, axis=0)
+    return {
+        'phases': results,
+        't_gov': np.max(t, axis=0),
+        'phase': np.array([name for name, _ in labels])[index],
+        'criterion': np.array([criterion for _, criterion in labels])[index],
+    }
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Thread pool evaluation of the vectorised PD 8010-2 calculations.
+
+For embedding wallthick in multithreaded hosts where process pools are not
+available. A batch is split into chunks of cases, each evaluated by
+wallthick.batch.evaluate on a thread pool. The calculations are NumPy array
+operations, which release the GIL, and share no mutable state, so chunks run
+concurrently. Each chunk writes to its own slice of the preallocated result
+arrays.
+
+A chunk that fails does not stop the others. Its results are left as NaN and
+the failure is returned as a structured error record instead of being raised
+or printed.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import batch
+
+
+def _evaluate_chunk(data, start, stop, method, outputs, results):
+    chunk = {key: value if value.ndim == 0 else value[start:stop]
+             for key, value in data.items()}
+    values = batch.evaluate(chunk, method=method, outputs=outputs)
+    for name in outputs:
+        results[name][start:stop] = values[name]
+
+
+def evaluate(data, method='bracket', outputs=None, threads=8,
+             chunk_size=16384, executor=None):
+    """Return the PD 8010-2 outputs for every case in data, evaluated in
+    chunks on a thread pool, as a tuple (results, errors).
+
+    results is a dict of arrays as returned by batch.evaluate. errors is a
+    list of dicts, one per failed chunk, with entries:
+    - 'chunk': Chunk index
+    - 'start', 'stop': Range of flattened case indices in the chunk
+    - 'error': Exception type name
+    - 'message': Exception message
+    The results of the cases in a failed chunk are NaN.
+
+    :param dict data: Pd8010 input data, values are numbers or arrays
+    :param str method: Collapse thickness method - see batch.evaluate
+    :param list outputs: Output names to evaluate, defaults to all outputs
+    :param int threads: Number of worker threads, if executor is not given
+    :param int chunk_size: Number of cases per chunk, at least one
+    :param Executor executor: Executor to submit chunks to, e.g. a host
+        application's thread pool, defaults to a new ThreadPoolExecutor
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            "chunk_size must be at least 1, got {}".format(chunk_size))
+    if outputs is None:
+        outputs = batch.outputs
+    keys = batch.plan(outputs)
+    shape = np.broadcast(*(np.asarray(data[key]) for key in batch.req_inputs
+                           if key in data)).shape
+    n = int(np.prod(shape))
+
+    # Scalar inputs are passed to every chunk as they are, arrays are
+    # flattened to the full shape and sliced
+    flat = {}
+    for key in keys:
+        value = np.asarray(data[key], dtype=float)
+        flat[key] = value.reshape(()) if value.size == 1 else \
+            np.broadcast_to(value, shape).reshape(-1)
+    results = {name: np.full(n, np.nan) for name in outputs}
+
+    bounds = [(start, min(start + chunk_size, n))
+              for start in range(0, n, chunk_size)]
+    own = executor is None
+    if own:
+        executor = ThreadPoolExecutor(max_workers=threads)
+    try:
+        futures = [executor.submit(_evaluate_chunk, flat, start, stop,
+                                   method, outputs, results)
+                   for start, stop in bounds]
+        errors = []
+        for index, (future, (start, stop)) in enumerate(zip(futures, bounds)):
+            error = future.exception()
+            if error is not None:
+                errors.append({'chunk': index, 'start': start, 'stop': stop,
+                               'error': type(error).__name__,
+                               'message': str(error)})
+    finally:
+        if own:
+            executor.shutdown()
+
+    return {name: results[name].reshape(shape) for name in outputs}, errors
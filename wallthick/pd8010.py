@@ -143,7 +143,8 @@ def req_thickness(t_min, t_corr, f_tol):
 # ==============================================
 
 
-def collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0):
+def collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0, method='newton', x0=None,
+                       full_output=False):
     """Return the nominal wall thickness [m] for local buckling due to external
     pressure - PD8010-2 Clause G.1.2.
 
@@ -151,13 +152,24 @@ def collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0):
     - Minimum internal pressure(zero)
     - Maximum external pressure(at water depth, d)
 
+    Solver methods:
+    - 'newton': secant iterations from x0, default 1e-3 m
+    - 'bracket': Newton iterations safeguarded by bisection within a bracket
+        of the physical root, starting from the elastic/plastic asymptote
+        where P_o equals the larger of P_e and P_y, or from x0, e.g. the
+        solution of a neighbouring case.
+
     :param float P_o: External pressure [Pa]
     :param float sig_y_d: De-rated yield strength [Pa]
     :param float E: Young's modulus [Pa]
     :param float v: Poisson's ratio [-]
     :param float D_o: Outside diameter [m]
-    :param float f_0: Pipeline ovality [-]    
+    :param float f_0: Pipeline ovality [-]
+    :param str method: Solver method, 'newton' or 'bracket'
+    :param float x0: Initial or previous wall thickness [m]
+    :param bool full_output: Also return the number of residual evaluations
     """
+    calls = [0]
 
     def P_e(t):
         """Return the critical pressure [Pa] for an elastic critical tube - PD8010-2
@@ -180,11 +192,49 @@ def collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0):
 
         :param float t: Wall thickness [m]
         """
+        calls[0] += 1
         term_1 = ((P_o / P_e(t)) - 1)
         term_2 = ((P_o / P_y(t))**2 - 1)
         return term_1 * term_2 - (P_o / P_y(t)) * f_0 * (D_o / t)
 
-    return scipy.optimize.newton(char_resist, 1e-3)
+    if method == 'newton':
+        t = scipy.optimize.newton(char_resist, 1e-3 if x0 is None else x0)
+    elif method == 'bracket':
+        # Thicknesses at which P_e and P_y equal the external pressure. Above
+        # the larger, the residual increases monotonically from at most zero
+        lo = max(D_o * (P_o * (1 - v**2) / (2 * E))**(1 / 3),
+                 P_o * D_o / (2 * sig_y_d))
+        # Both pressure ratios and the ovality term are at most 1/2 above
+        # hi, so the residual is positive
+        hi = max(2 * lo, D_o * math.sqrt(P_o * f_0 / sig_y_d))
+        t = lo if x0 is None else min(max(x0, lo), hi)
+        for _ in range(50):
+            R = char_resist(t)
+            if R == 0:
+                break
+            elif R < 0:
+                lo = t
+            else:
+                hi = t
+            # Newton step, bisecting the bracket if the step leaves it
+            a, b = P_o / P_e(t), P_o / P_y(t)
+            dR_dt = (-3 * a * (b**2 - 1) - 2 * b**2 * (a - 1) +
+                     2 * b * f_0 * D_o / t) / t
+            t_new = t - R / dR_dt
+            if not lo < t_new < hi:
+                t_new = 0.5 * (lo + hi)
+            converged = abs(t_new - t) <= 1.48e-8
+            t = t_new
+            if converged:
+                break
+        else:
+            raise RuntimeError("Collapse thickness failed to converge.")
+    else:
+        raise ValueError("Unknown collapse method: {}".format(method))
+
+    if full_output:
+        return t, calls[0]
+    return t
 
 
 # G.2 Propagation Buckling
@@ -290,7 +340,8 @@ class Pd8010(object):
         # include safety factor
         P_o = self.f_s * external_pressure(self.rho_w, self.g, d)
         return collapse_thickness(
-            P_o, self.sig_y_d, self.E, self.v, self.D_o, self.f_0)
+            P_o, self.sig_y_d, self.E, self.v, self.D_o, self.f_0,
+            method='bracket')
 
     @property
     def t_b(self):
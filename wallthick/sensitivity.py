@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+"""
+Input sensitivities of the PD 8010-2 calculations.
+
+Analytic derivatives of t_h, t_c, t_b and P_st with respect to every
+Pd8010 input, evaluated over arrays of cases alongside the forward
+calculation. The hoop, buckle and test pressure equations are
+differentiated in closed form and the collapse thickness by implicit
+differentiation of the Equation (G.1) residual at its root.
+"""
+
+import numpy as np
+
+from . import batch
+from . import pd8010
+
+
+def _zeros(shape):
+    return {key: np.zeros(shape) for key in batch.req_inputs}
+
+
+def _hoop_thickness_derivs(P_i, P_o, D_o, sig_y_d):
+    """Return the minimum hoop thickness [m] and its derivatives with respect
+    to P_i, P_o, D_o and sig_y_d as a tuple.
+    """
+    t = batch.hoop_thickness(P_i, P_o, D_o, sig_y_d)
+    delta_P = np.abs(P_i - P_o)
+    sign = np.sign(P_i - P_o)
+    S = pd8010.n_s * sig_y_d
+    t_thin = delta_P * D_o / (2 * S)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        thin = D_o / t_thin > 20
+
+        # Thin wall, Equation (3)
+        dthin_ddP = D_o / (2 * S)
+        dthin_dD = delta_P / (2 * S)
+        dthin_dS = -t_thin / S
+
+        # Thick wall, Equation (5): t = D_o * (1 - q) / 2
+        q = np.sqrt((S - delta_P) / (S + delta_P))
+        dq_ddP = -S / (q * (S + delta_P)**2)
+        dq_dS = delta_P / (q * (S + delta_P)**2)
+        dthick_ddP = -0.5 * D_o * dq_ddP
+        dthick_dD = 0.5 * (1 - q)
+        dthick_dS = -0.5 * D_o * dq_dS
+
+    dt_ddP = np.where(thin, dthin_ddP, dthick_ddP)
+    dt_dS = np.where(thin, dthin_dS, dthick_dS)
+    return (t,
+            sign * dt_ddP,
+            -sign * dt_ddP,
+            np.where(thin, dthin_dD, dthick_dD),
+            pd8010.n_s * dt_dS)
+
+
+def _hoop_pressure_derivs(t, D_o, sig):
+    """Return the derivatives of the hoop pressure with respect to t, D_o and
+    sig as a tuple. The derivative with respect to external pressure is one.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        thin = D_o / t > 20
+
+        # Thin wall, Equation (3)
+        dthin_dt = 2 * sig / D_o
+        dthin_dD = -2 * sig * t / D_o**2
+        dthin_dsig = 2 * t / D_o
+
+        # Thick wall, Equation (5): P = sig * N / M + P_o
+        N = D_o**2 - (D_o - 2 * t)**2
+        M = D_o**2 + (D_o - 2 * t)**2
+        dthick_dt = sig * 8 * D_o**2 * (D_o - 2 * t) / M**2
+        dthick_dD = sig * (4 * t * M - N * 4 * (D_o - t)) / M**2
+        dthick_dsig = N / M
+
+    return (np.where(thin, dthin_dt, dthick_dt),
+            np.where(thin, dthin_dD, dthick_dD),
+            np.where(thin, dthin_dsig, dthick_dsig))
+
+
+def _pressure_derivs(rho_w, g, d, dd_dh, dd_dH_t, dd_dH_w):
+    """Return the derivatives of the external pressure at depth d with respect
+    to each of its inputs as a dict.
+    """
+    return {'rho_w': g * d,
+            'g': rho_w * d,
+            'h': rho_w * g * dd_dh,
+            'H_t': rho_w * g * dd_dH_t,
+            'H_w': rho_w * g * dd_dH_w}
+
+
+def sensitivities(data, outputs=None):
+    """Return the PD 8010-2 outputs and their derivatives with respect to each
+    input for every case in data as a tuple (results, jacobian).
+
+    results is a dict of arrays as returned by wallthick.batch.evaluate and
+    jacobian is a dict of dicts of arrays, i.e. jacobian['t_c']['h'] is the
+    derivative of the collapse thickness with respect to water depth. Every
+    output has an entry for every input in wallthick.batch.req_inputs.
+
+    When outputs is given, only those outputs and their derivatives are
+    evaluated, e.g. the collapse thickness root solve is skipped unless t_c
+    is selected. P_lt has no jacobian entry.
+
+    :param dict data: Pd8010 input data, values are numbers or arrays
+    :param list outputs: Output names to evaluate, defaults to all outputs
+    """
+    if outputs is None:
+        outputs = batch.outputs
+    d = batch.input_arrays(data, batch.plan(outputs))
+    shape = next(iter(d.values())).shape
+    if {'t_h', 'P_st'} & set(outputs):
+        d_min, _ = pd8010.water_depths(d['h'], 0, d['H_w'])
+        P_o_min = pd8010.external_pressure(d['rho_w'], d['g'], d_min)
+        dP_o_min = _pressure_derivs(d['rho_w'], d['g'], d_min, 1, 0, -0.5)
+    if {'t_c', 't_b'} & set(outputs):
+        _, d_max = pd8010.water_depths(d['h'], d['H_t'], d['H_w'])
+        P_o_max = pd8010.external_pressure(d['rho_w'], d['g'], d_max)
+        dP_o_max = _pressure_derivs(d['rho_w'], d['g'], d_max, 1, 1, 0.5)
+
+    results = {}
+    jacobian = {}
+
+    # Pressure containment
+    if 't_h' in outputs:
+        P_i = pd8010.internal_pressure(d['P_d'], d['P_h'])
+        t_min, dt_dP_i, dt_dP_o, dt_dD, dt_dsig = _hoop_thickness_derivs(
+            P_i, P_o_min, d['D_o'], d['sig_y_d'])
+        k = 1 / (1 - d['f_tol'])
+        results['t_h'] = t_h = (t_min + d['t_corr']) * k
+        jac = jacobian['t_h'] = _zeros(shape)
+        jac['P_d'] = jac['P_h'] = k * dt_dP_i
+        for key, value in dP_o_min.items():
+            jac[key] = k * dt_dP_o * value
+        jac['D_o'] = k * dt_dD
+        jac['sig_y_d'] = k * dt_dsig
+        jac['t_corr'] = k
+        jac['f_tol'] = t_h * k
+
+    # Hydrostatic collapse, implicit differentiation of R(t, x) = 0
+    if 't_c' in outputs:
+        P_o_c = d['f_s'] * P_o_max
+        t = results['t_c'] = batch.collapse_thickness(
+            P_o_c, d['sig_y_d'], d['E'], d['v'], d['D_o'], d['f_0'])
+        _, dR_dt = batch.collapse_residual(
+            t, P_o_c, d['sig_y_d'], d['E'], d['v'], d['D_o'], d['f_0'])
+        a = P_o_c * (1 - d['v']**2) * d['D_o']**3 / (2 * d['E'] * t**3)
+        b = P_o_c * d['D_o'] / (2 * d['sig_y_d'] * t)
+        c = b * d['f_0'] * d['D_o'] / t
+
+        def dR(da, db, dc):
+            return da * (b**2 - 1) + (a - 1) * 2 * b * db - dc
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dR_dP_o = dR(a, b, c) / P_o_c
+        jac = jacobian['t_c'] = _zeros(shape)
+        jac['f_s'] = -dR_dP_o * P_o_max / dR_dt
+        for key, value in dP_o_max.items():
+            jac[key] = -dR_dP_o * d['f_s'] * value / dR_dt
+        jac['sig_y_d'] = -dR(0, -b, -c) / d['sig_y_d'] / dR_dt
+        jac['E'] = -dR(-a, 0, 0) / d['E'] / dR_dt
+        jac['v'] = -dR(-2 * d['v'] * a / (1 - d['v']**2), 0, 0) / dR_dt
+        jac['D_o'] = -dR(3 * a, b, 2 * c) / d['D_o'] / dR_dt
+        jac['f_0'] = -dR(0, 0, b * d['D_o'] / t) / dR_dt
+
+    # Propagation buckling, Equation (G.21)
+    if 't_b' in outputs:
+        t = results['t_b'] = pd8010.buckle_thickness(
+            d['D_o'], P_o_max, d['sig_y_d'])
+        jac = jacobian['t_b'] = _zeros(shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dt_dP_p = 4 / 9 * t / P_o_max
+        for key, value in dP_o_max.items():
+            jac[key] = dt_dP_p * value
+        jac['D_o'] = t / d['D_o']
+        jac['sig_y_d'] = -4 / 9 * t / d['sig_y_d']
+
+    # Strength test pressure, minimum of the hoop and 1.5 * P_d criteria
+    if 'P_st' in outputs:
+        t_min = d['t_sel'] * (1 - d['f_tol'])
+        P_hoop = batch.hoop_pressure(t_min, d['D_o'], P_o_min,
+                                     0.9 * d['sig_y'])
+        P_test = 1.5 * d['P_d'] + d['P_h']
+        results['P_st'] = np.minimum(P_hoop, P_test)
+        hoop = P_hoop < P_test
+        dP_dt, dP_dD, dP_dsig = _hoop_pressure_derivs(
+            t_min, d['D_o'], 0.9 * d['sig_y'])
+        jac = jacobian['P_st'] = _zeros(shape)
+        jac['t_sel'] = np.where(hoop, dP_dt * (1 - d['f_tol']), 0)
+        jac['f_tol'] = np.where(hoop, -dP_dt * d['t_sel'], 0)
+        jac['D_o'] = np.where(hoop, dP_dD, 0)
+        jac['sig_y'] = np.where(hoop, 0.9 * dP_dsig, 0)
+        for key, value in dP_o_min.items():
+            jac[key] = np.where(hoop, value, 0)
+        jac['P_d'] = np.where(hoop, 0, 1.5)
+        jac['P_h'] = np.where(hoop, 0, 1)
+
+    if 'P_lt' in outputs:
+        results['P_lt'] = 1.1 * d['P_d']
+    return results, jacobian
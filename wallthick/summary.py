@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming summaries of large batch calculations.
+
+A Summary is fed the results of a batch run chunk by chunk and keeps, in
+constant memory:
+- the number of cases governed by each criterion (t_h, t_c or t_b)
+- a histogram of the governing required wall thickness, from which
+    percentiles are estimated
+- the worst (thickest) cases for each API 5L outside diameter
+
+Summaries of different chunks or workers are combined with merge.
+"""
+
+import heapq
+
+import numpy as np
+
+from . import api5l
+
+criteria = ['t_h', 't_c', 't_b']
+
+
+class Summary(object):
+    """A mergeable summary of required wall thicknesses.
+
+    Thicknesses are binned on a logarithmic grid of n_bins between t_lo and
+    t_hi, so percentiles within that range have a relative error no greater
+    than (t_hi / t_lo)^(1 / n_bins) - 1, about 0.6 percent by default.
+
+    :param int k: Number of worst cases kept per outside diameter
+    :param float t_lo: Lower bound of the histogram [m]
+    :param float t_hi: Upper bound of the histogram [m]
+    :param int n_bins: Number of histogram bins
+    :param int start: Case number of the first case, for numbering cases when
+        case_ids are not given. Summaries to be merged need distinct case
+        numbers, e.g. each worker's offset into the run.
+    """
+
+    def __init__(self, k=10, t_lo=1e-5, t_hi=1, n_bins=2000, start=0):
+        self.k = k
+        self.start = start
+        self.edges = np.geomspace(t_lo, t_hi, n_bins + 1)
+        # Includes underflow and overflow bins
+        self.counts = np.zeros(n_bins + 2, dtype=np.int64)
+        self.governing = {name: 0 for name in criteria}
+        self.cases = 0
+        self.invalid = 0
+        self.t_min = np.inf
+        self.t_max = -np.inf
+        self.worst = {}
+
+    def update(self, results, D_o, case_ids=None):
+        """Add a chunk of results to the summary.
+
+        :param dict results: Arrays of t_h, t_c and t_b, e.g. from
+            wallthick.batch.evaluate
+        :param array D_o: Outside diameter of each case [m]
+        :param array case_ids: Identifier of each case, defaults to the
+            running case number from start
+        """
+        t = np.stack(np.broadcast_arrays(
+            *(np.ravel(results[name]) for name in criteria)))
+        n = t.shape[1]
+        if case_ids is None:
+            first = self.start + self.cases
+            case_ids = np.arange(first, first + n)
+        case_ids = np.broadcast_to(case_ids, (n,))
+        D_o = np.broadcast_to(np.ravel(D_o), (n,))
+
+        # Cases with any undefined thickness are counted as invalid
+        valid = ~np.isnan(t).any(axis=0)
+        t, case_ids, D_o = t[:, valid], case_ids[valid], D_o[valid]
+        index = np.argmax(t, axis=0)
+        t_req = t[index, np.arange(len(index))]
+
+        self.cases += n
+        self.invalid += n - len(t_req)
+        for i, count in enumerate(np.bincount(index, minlength=3)):
+            self.governing[criteria[i]] += int(count)
+        self.counts += np.bincount(np.searchsorted(self.edges, t_req),
+                                   minlength=len(self.counts))
+        if len(t_req):
+            self.t_min = min(self.t_min, float(t_req.min()))
+            self.t_max = max(self.t_max, float(t_req.max()))
+
+        # Group by API 5L outside diameter [mm], other sizes under None
+        D_o_mm = np.round(1000 * D_o, 1)
+        for size in np.unique(D_o_mm):
+            members = np.flatnonzero(D_o_mm == size)
+            if len(members) > self.k:
+                top = np.argpartition(t_req[members], -self.k)[-self.k:]
+                members = members[top]
+            key = float(size) if float(size) in api5l.sizes else None
+            heap = self.worst.setdefault(key, [])
+            for i in members:
+                self._push(heap, (float(t_req[i]), case_ids[i].item(),
+                                  criteria[index[i]]))
+
+    def _push(self, heap, item):
+        if len(heap) < self.k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def merge(self, other):
+        """Add the contents of another summary with the same bins to this one
+        and return it.
+
+        :param Summary other: Summary to merge
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Summaries have different histogram bins")
+        self.cases += other.cases
+        self.invalid += other.invalid
+        self.counts += other.counts
+        for name in criteria:
+            self.governing[name] += other.governing[name]
+        self.t_min = min(self.t_min, other.t_min)
+        self.t_max = max(self.t_max, other.t_max)
+        for key, items in other.worst.items():
+            heap = self.worst.setdefault(key, [])
+            for item in items:
+                self._push(heap, item)
+        return self
+
+    def percentile(self, q):
+        """Return the estimated q-th percentile of the governing required wall
+        thickness [m].
+
+        :param float q: Percentile, between 0 and 100
+        """
+        total = self.counts.sum()
+        if not total:
+            return np.nan
+        cumulative = np.cumsum(self.counts)
+        rank = q / 100 * total
+        i = min(int(np.searchsorted(cumulative, rank)), len(self.counts) - 1)
+        if i == 0:
+            return self.t_min
+        if i == len(self.counts) - 1:
+            return self.t_max
+        # Interpolate geometrically within the bin
+        lo, hi = self.edges[i - 1], self.edges[i]
+        fraction = (rank - (cumulative[i] - self.counts[i])) / self.counts[i]
+        t = lo * (hi / lo)**fraction
+        return float(min(max(t, self.t_min), self.t_max))
+
+    def report(self, percentiles=(5, 50, 95, 99)):
+        """Return a dict summarising the results.
+
+        :param tuple percentiles: Percentiles of required wall thickness to
+            report
+        """
+        return {
+            'cases': self.cases,
+            'invalid': self.invalid,
+            'governing': dict(self.governing),
+            't_min': self.t_min,
+            't_max': self.t_max,
+            'percentiles': {q: self.percentile(q) for q in percentiles},
+            'worst': {key: sorted(heap, reverse=True)
+                      for key, heap in self.worst.items()},
+        }
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+Collapse thickness surrogate tables.
+
+The PD8010-2 Equation (G.1) collapse thickness can be written in terms of
+dimensionless groups only. With the elastic asymptote
+tau_e = (P_o * (1 - v^2) / (2 * E))^(1/3) and t = D_o * tau_e * u, the
+residual becomes
+
+    (1 / u^3 - 1) * (k^2 / u^2 - 1) - g / u^2 = 0
+
+where k = P_o / (2 * sig_y_d * tau_e) and g = k * f_0 / tau_e, so the four
+groups P_o/E, sig_y_d/E, v and f_0 collapse to the two groups k and g.
+
+A CollapseTable tabulates log(u / max(1, k)) over a regular grid in log k and
+log g and evaluates the collapse thickness by bilinear interpolation. Every
+interpolated value is checked against the exact residual and cases outside
+the tabulated domain, or whose error cannot be shown to be within the
+requested tolerance, are solved exactly.
+"""
+
+import os
+import tempfile
+import threading
+import zipfile
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from . import batch
+
+default_path = os.path.join(
+    os.path.expanduser('~'), '.cache', 'wallthick', 'collapse_table.npz')
+
+_default_table = None
+_default_table_lock = threading.Lock()
+
+
+def _groups(P_o, sig_y_d, E, v, f_0):
+    """Return the elastic asymptote tau_e and the groups k and g as a tuple.
+    """
+    tau_e = (P_o * (1 - v**2) / (2 * E))**(1 / 3)
+    k = P_o / (2 * sig_y_d * tau_e)
+    g = k * f_0 / tau_e
+    return tau_e, k, g
+
+
+def _residual(u, k, g):
+    """Return the dimensionless Equation (G.1) residual.
+    """
+    return (1 / u**3 - 1) * (k**2 / u**2 - 1) - g / u**2
+
+
+def _solve_ratio(k, g, iterations=60):
+    """Return the root u of the dimensionless Equation (G.1) residual by
+    bisection.
+
+    The residual is non-positive at u = max(1, k), where one of the elastic
+    or plastic terms vanishes, and increases monotonically to one above it.
+    """
+    lo = np.maximum(1, k)
+    hi = 2 * lo
+    below = _residual(hi, k, g) <= 0
+    while below.any():
+        hi = np.where(below, 2 * hi, hi)
+        below = _residual(hi, k, g) <= 0
+    for _ in range(iterations):
+        mid = np.sqrt(lo * hi)
+        below = _residual(mid, k, g) <= 0
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return np.sqrt(lo * hi)
+
+
+class CollapseTable(object):
+    """A tabulated PD8010-2 collapse thickness surrogate.
+    """
+
+    def __init__(self, log_k, log_g, log_ratio, max_error):
+        self.log_k = np.asarray(log_k, dtype=float)
+        self.log_g = np.asarray(log_g, dtype=float)
+        self.log_ratio = np.asarray(log_ratio, dtype=float)
+        self.max_error = float(max_error)
+        self._interp = RegularGridInterpolator(
+            (self.log_k, self.log_g), self.log_ratio)
+
+    @classmethod
+    def build(cls, k_range=(1e-5, 1e3), g_range=(1e-8, 1e5), n_k=401,
+              n_g=401):
+        """Return a new table solved exactly on a regular log grid.
+
+        The maximum relative interpolation error is measured at the centre
+        of every grid cell and stored as max_error.
+
+        :param tuple k_range: Minimum and maximum k [-]
+        :param tuple g_range: Minimum and maximum g [-]
+        :param int n_k: Number of grid points in k
+        :param int n_g: Number of grid points in g
+        """
+        log_k = np.linspace(np.log(k_range[0]), np.log(k_range[1]), n_k)
+        log_g = np.linspace(np.log(g_range[0]), np.log(g_range[1]), n_g)
+        k, g = np.meshgrid(np.exp(log_k), np.exp(log_g), indexing='ij')
+        log_ratio = np.log(_solve_ratio(k, g) / np.maximum(1, k))
+
+        table = cls(log_k, log_g, log_ratio, np.inf)
+        mid_k = np.exp(0.5 * (log_k[1:] + log_k[:-1]))
+        mid_g = np.exp(0.5 * (log_g[1:] + log_g[:-1]))
+        k, g = np.meshgrid(mid_k, mid_g, indexing='ij')
+        exact = _solve_ratio(k, g)
+        approx = table._ratio(k, g)
+        table.max_error = float(np.max(np.abs(approx / exact - 1)))
+        return table
+
+    @classmethod
+    def load(cls, path):
+        """Return a table read from a .npz file written by save.
+
+        :param str path: File path
+        """
+        with np.load(path) as f:
+            return cls(f['log_k'], f['log_g'], f['log_ratio'],
+                       f['max_error'])
+
+    def save(self, path):
+        """Write the table to a .npz file.
+
+        The table is written to a temporary file in the same directory and
+        renamed over path, so readers never see a partly written file.
+
+        :param str path: File path
+        """
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                   prefix='.tmp-', suffix='.npz')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(f, log_k=self.log_k, log_g=self.log_g,
+                                    log_ratio=self.log_ratio,
+                                    max_error=self.max_error)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def in_domain(self, k, g):
+        """Return a boolean array, True where k and g lie within the table.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_k = np.log(k)
+            log_g = np.log(g)
+        return ((log_k >= self.log_k[0]) & (log_k <= self.log_k[-1]) &
+                (log_g >= self.log_g[0]) & (log_g <= self.log_g[-1]))
+
+    def _ratio(self, k, g):
+        points = np.stack([np.log(k), np.log(g)], axis=-1)
+        return np.exp(self._interp(points)) * np.maximum(1, k)
+
+    def collapse_thickness(self, P_o, sig_y_d, E, v, D_o, f_0, rtol=1e-3):
+        """Return the nominal wall thickness [m] for local buckling due to
+        external pressure - PD8010-2 Clause G.1.2, by table lookup.
+
+        Each interpolated thickness is accepted only if the Equation (G.1)
+        residual changes sign between t / (1 + rtol) and t / (1 - rtol), which
+        guarantees a relative error no greater than rtol. Other cases, and
+        cases outside the tabulated domain, are solved with
+        wallthick.batch.collapse_thickness.
+
+        :param array P_o: External pressure [Pa]
+        :param array sig_y_d: De-rated yield strength [Pa]
+        :param array E: Young's modulus [Pa]
+        :param array v: Poisson's ratio [-]
+        :param array D_o: Outside diameter [m]
+        :param array f_0: Pipeline ovality [-]
+        :param float rtol: Maximum relative error [-]
+        """
+        args = np.broadcast_arrays(*(np.atleast_1d(arg).astype(float) for arg
+                                     in (P_o, sig_y_d, E, v, D_o, f_0)))
+        shape = np.broadcast(P_o, sig_y_d, E, v, D_o, f_0).shape
+        P_o, sig_y_d, E, v, D_o, f_0 = args
+        t = np.full(P_o.shape, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tau_e, k, g = _groups(P_o, sig_y_d, E, v, f_0)
+        ok = self.in_domain(k, g)
+
+        t[ok] = D_o[ok] * tau_e[ok] * self._ratio(k[ok], g[ok])
+        # t_lo, where one of the elastic or plastic terms vanishes, bounds
+        # the monotonic branch of the residual from below
+        t_lo = D_o[ok] * tau_e[ok] * np.maximum(1, k[ok])
+        sub = [arg[ok] for arg in args]
+        R_lo, _ = batch.collapse_residual(
+            np.maximum(t[ok] / (1 + rtol), t_lo), *sub)
+        with np.errstate(divide='ignore'):
+            R_hi, _ = batch.collapse_residual(t[ok] / (1 - rtol), *sub)
+        ok[ok] = (R_lo <= 0) & (R_hi >= 0)
+
+        exact = ~ok
+        if exact.any():
+            t[exact] = batch.collapse_thickness(
+                *(arg[exact] for arg in args), x0=t[exact])
+        return t.reshape(shape)
+
+
+def default_table(path=default_path):
+    """Return the default collapse table, loading it from path or building
+    and saving it there on first use.
+
+    Safe to call from several threads, the table is loaded or built once. A
+    file that cannot be read, e.g. one left truncated, is rebuilt.
+
+    :param str path: File path
+    """
+    global _default_table
+    with _default_table_lock:
+        if _default_table is None:
+            try:
+                _default_table = CollapseTable.load(path)
+            except (IOError, EOFError, KeyError, ValueError,
+                    zipfile.BadZipFile):
+                _default_table = CollapseTable.build()
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _default_table.save(path)
+    return _default_table
+
+
+def collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0, rtol=1e-3, table=None):
+    """Return the nominal wall thickness [m] for local buckling due to external
+    pressure - PD8010-2 Clause G.1.2, using a collapse table.
+
+    :param array P_o: External pressure [Pa]
+    :param array sig_y_d: De-rated yield strength [Pa]
+    :param array E: Young's modulus [Pa]
+    :param array v: Poisson's ratio [-]
+    :param array D_o: Outside diameter [m]
+    :param array f_0: Pipeline ovality [-]
+    :param float rtol: Maximum relative error [-]
+    :param CollapseTable table: Table to use, defaults to default_table()
+    """
+    if table is None:
+        table = default_table()
+    return table.collapse_thickness(P_o, sig_y_d, E, v, D_o, f_0, rtol)